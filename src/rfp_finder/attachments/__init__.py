@@ -2,14 +2,23 @@
 
 from rfp_finder.store.attachment_cache import AttachmentCacheStore, CachedAttachment
 
-from .enricher import enrich_opportunity
+from .enricher import (
+    enrich_opportunities,
+    enrich_opportunities_async,
+    enrich_opportunity,
+    enrich_opportunity_async,
+)
 from .extractor import extract_text_from_pdf
-from .fetcher import fetch_attachment
+from .fetcher import fetch_attachment, fetch_attachment_async
 
 __all__ = [
     "AttachmentCacheStore",
     "CachedAttachment",
+    "enrich_opportunities",
+    "enrich_opportunities_async",
     "enrich_opportunity",
+    "enrich_opportunity_async",
     "extract_text_from_pdf",
     "fetch_attachment",
+    "fetch_attachment_async",
 ]
@@ -1,16 +1,50 @@
 """Enrich opportunities with extracted attachment text."""
 
+import asyncio
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from rfp_finder.models.opportunity import NormalizedOpportunity
+import httpx
 
-from .extractor import extract_text_from_file
-from .fetcher import fetch_attachment
+from rfp_finder.models.opportunity import AttachmentRef, NormalizedOpportunity
+
+from .extractor import MAX_EXTRACTED_CHARS, extract_text_from_file
+from .fetcher import (
+    DomainRateLimiter,
+    _default_rate_limiter,
+    _domain_from_url,
+    _file_sha256,
+    fetch_attachment_async,
+)
 
 if TYPE_CHECKING:
     from rfp_finder.store.attachment_cache import AttachmentCacheStore
 
+# Concurrency caps for attachment downloads (global, and per host to stay polite)
+_MAX_CONCURRENT_FETCHES = 16
+_MAX_FETCHES_PER_DOMAIN = 4
+# Opportunities enriched at once by enrich_opportunities
+_MAX_CONCURRENT_OPPORTUNITIES = 8
+
+
+def _new_async_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=60.0,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=16),
+    )
+
+
+def _ensure_no_running_loop(name: str) -> None:
+    """The sync wrappers start their own event loop, which asyncio forbids inside another."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    raise RuntimeError(
+        f"{name}() cannot be called from a running event loop; await {name}_async() instead"
+    )
+
 
 def enrich_opportunity(
     opp: NormalizedOpportunity,
@@ -22,44 +56,188 @@ def enrich_opportunity(
     """
     Fetch and extract text from attachments. Returns combined text:
     opp summary + extracted attachment texts (with source labels).
+    Sync wrapper around enrich_opportunity_async; attachments are fetched concurrently.
+    From async code (an event loop already running), await enrich_opportunity_async.
     """
+    _ensure_no_running_loop("enrich_opportunity")
+    return asyncio.run(
+        enrich_opportunity_async(opp, cache_dir, cache_store, fetch_missing=fetch_missing)
+    )
 
+
+async def enrich_opportunity_async(
+    opp: NormalizedOpportunity,
+    cache_dir: Path,
+    cache_store: "AttachmentCacheStore",
+    *,
+    fetch_missing: bool = True,
+    client: httpx.AsyncClient | None = None,
+    rate_limiter: DomainRateLimiter | None = None,
+    in_flight: dict[str, asyncio.Task] | None = None,
+) -> str:
+    """
+    Async enrich: attachments are downloaded concurrently (bounded globally and per domain).
+    Pass client to share a connection pool across calls (otherwise one is created per
+    call); without rate_limiter, a process-wide one paces each domain across calls.
+    Calls running concurrently must share one in_flight dict (URL -> attachment task),
+    as enrich_opportunities_async does, so a URL they share is downloaded once.
+    """
     parts: list[str] = []
     if opp.summary:
         parts.append(f"[Main]\n{opp.summary}")
 
-    for att in opp.attachments or []:
-        if not att.url:
-            continue
-        cached = cache_store.get_cached(att.url)
-        text = ""
+    attachments = [att for att in opp.attachments or [] if att.url]
+    # One download per URL: concurrent downloads of a URL would share one .part file,
+    # whether listed twice here or by other opportunities sharing in_flight
+    in_flight = {} if in_flight is None else in_flight
+    first_by_url: dict[str, AttachmentRef] = {}
+    for att in attachments:
+        first_by_url.setdefault(att.url, att)
+    unique = list(first_by_url.values())
+    fetch_limit = asyncio.Semaphore(_MAX_CONCURRENT_FETCHES)
+    domain_limits: dict[str, asyncio.Semaphore] = {}
+    rate_limiter = rate_limiter or _default_rate_limiter()
+    cache_map = cache_store.get_cached_many([att.url for att in unique])
+
+    async def _attachment_text(
+        att: AttachmentRef, http: httpx.AsyncClient
+    ) -> tuple[str, dict | None]:
+        """Return (text, cache row to upsert or None)."""
+        cached = cache_map.get(att.url)
         if cached and cached.extraction_status == "success" and cached.extracted_text:
-            text = cached.extracted_text
-        elif fetch_missing:
-            local_path, err = fetch_attachment(
-                att.url, cache_dir, skip_existing=True
+            # Rows cached before extraction was capped may hold the full document text
+            return cached.extracted_text[:MAX_EXTRACTED_CHARS], None
+        if not fetch_missing:
+            return "", None
+        domain_limit = domain_limits.setdefault(
+            _domain_from_url(att.url), asyncio.Semaphore(_MAX_FETCHES_PER_DOMAIN)
+        )
+        async with fetch_limit, domain_limit:
+            local_path, err = await fetch_attachment_async(
+                att.url,
+                cache_dir,
+                client=http,
+                rate_limiter=rate_limiter,
+                skip_existing=True,
             )
-            if local_path:
-                extracted, page_count, ext_err = extract_text_from_file(
-                    local_path, att.mime_type
-                )
-                cache_store.upsert(
-                    att.url,
-                    str(local_path),
-                    extraction_status="failed" if ext_err else "success",
-                    extracted_text=extracted if not ext_err else None,
-                    text_length=len(extracted) if not ext_err else None,
-                    page_count=page_count if not ext_err else None,
-                    error_message=ext_err,
-                )
-                if not ext_err:
-                    text = extracted
+        if not local_path:
+            return "", None
+        digest = await asyncio.to_thread(_file_sha256, local_path)
+        same_file = cache_store.get_by_content_hash(digest)
+        if same_file and same_file.extracted_text:
+            # Identical bytes already extracted under another URL (e.g. amendment re-host)
+            extracted, page_count, ext_err = (
+                same_file.extracted_text,
+                same_file.page_count or 0,
+                None,
+            )
+        else:
+            extracted, page_count, ext_err = await asyncio.to_thread(
+                extract_text_from_file, local_path, att.mime_type
+            )
+        row = dict(
+            url=att.url,
+            local_path=str(local_path),
+            extraction_status="failed" if ext_err else "success",
+            extracted_text=extracted if not ext_err else None,
+            text_length=len(extracted) if not ext_err else None,
+            page_count=page_count if not ext_err else None,
+            error_message=ext_err,
+            content_hash=digest,
+        )
+        return ("" if ext_err else extracted), row
+
+    def _task(att: AttachmentRef, http: httpx.AsyncClient) -> asyncio.Task:
+        """Task for att's URL, joining one already started by a concurrent call."""
+        task = in_flight.get(att.url)
+        if task is None:
+            task = asyncio.ensure_future(_attachment_text(att, http))
+            in_flight[att.url] = task
+        return task
+
+    own_client = client is None
+    http = client or _new_async_client()
+    try:
+        results = await asyncio.gather(*(_task(att, http) for att in unique))
+    finally:
+        if own_client:
+            await http.aclose()
+
+    # Written after all downloads finish so no transaction is held open across network I/O
+    rows = [row for _, row in results if row]
+    if rows:
+        with cache_store.transaction():
+            for row in rows:
+                cache_store.upsert(**row)
+
+    text_by_url = {att.url: text for att, (text, _) in zip(unique, results)}
+    for att in attachments:
+        text = text_by_url[att.url]
         if text.strip():
             label = att.label or Path(att.url).name or "attachment"
-            parts.append(f"[Attachment: {label}]\n{text[:50000]}")  # cap size
+            parts.append(f"[Attachment: {label}]\n{text}")
 
     return "\n\n---\n\n".join(parts)
 
 
+def enrich_opportunities(
+    opps: list[NormalizedOpportunity],
+    cache_dir: Path,
+    cache_store: "AttachmentCacheStore",
+    *,
+    concurrency: int = _MAX_CONCURRENT_OPPORTUNITIES,
+    fetch_missing: bool = True,
+) -> list[str]:
+    """
+    Enrich many opportunities, up to concurrency at a time. Returns combined texts
+    in input order. Sync wrapper around enrich_opportunities_async (await that one
+    from async code).
+    """
+    _ensure_no_running_loop("enrich_opportunities")
+    return asyncio.run(
+        enrich_opportunities_async(
+            opps,
+            cache_dir,
+            cache_store,
+            concurrency=concurrency,
+            fetch_missing=fetch_missing,
+        )
+    )
+
+
+async def enrich_opportunities_async(
+    opps: list[NormalizedOpportunity],
+    cache_dir: Path,
+    cache_store: "AttachmentCacheStore",
+    *,
+    concurrency: int = _MAX_CONCURRENT_OPPORTUNITIES,
+    fetch_missing: bool = True,
+) -> list[str]:
+    """
+    Async batch enrich: one HTTP client is shared by the whole batch, and the
+    process-wide per-domain rate limiter paces opportunities on the same host.
+    """
+    limit = asyncio.Semaphore(max(1, concurrency))
+    rate_limiter = _default_rate_limiter()
+    # Attachments shared between opportunities (e.g. standard terms) are fetched once
+    in_flight: dict[str, asyncio.Task] = {}
+
+    async with _new_async_client() as http:
+
+        async def _one(opp: NormalizedOpportunity) -> str:
+            async with limit:
+                return await enrich_opportunity_async(
+                    opp,
+                    cache_dir,
+                    cache_store,
+                    fetch_missing=fetch_missing,
+                    client=http,
+                    rate_limiter=rate_limiter,
+                    in_flight=in_flight,
+                )
+
+        return list(await asyncio.gather(*(_one(opp) for opp in opps)))
+
+
 # Type alias for late import
 AttachmentCacheStore = "AttachmentCacheStore"
@@ -1,7 +1,12 @@
 """Attachment download with caching and rate limiting."""
 
+import asyncio
+import atexit
+import functools
 import hashlib
+import os
 import time
+import weakref
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -9,8 +14,14 @@ import httpx
 
 # Rate limit: min delay between requests per domain (seconds)
 _RATE_LIMIT_DELAY = 1.0
+# Upper bound for the per-domain delay after the server asks us to back off
+_MAX_RATE_LIMIT_DELAY = 30.0
 _last_request_by_domain: dict[str, float] = {}
 
+# Downloads are streamed to disk in chunks through a large write buffer
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+_WRITE_BUFFER_SIZE = 1 << 20
+
 
 def _domain_from_url(url: str) -> str:
     """Extract domain for rate limiting."""
@@ -20,8 +31,128 @@ def _domain_from_url(url: str) -> str:
         return "unknown"
 
 
+class DomainRateLimiter:
+    """
+    Async per-domain rate limiter: enforces a minimum gap between requests to the
+    same host while leaving other hosts unblocked. Backs off when the server
+    answers 429/503 (honouring Retry-After) and recovers on success. Pacing state
+    carries over between event loops (e.g. successive asyncio.run calls), so one
+    limiter can be shared across them.
+    """
+
+    def __init__(self, min_interval: float = _RATE_LIMIT_DELAY):
+        self._min_interval = min_interval
+        # Per-domain lock and the loop it belongs to (asyncio locks are bound to one loop)
+        self._locks: dict[str, tuple[asyncio.Lock, weakref.ref]] = {}
+        self._intervals: dict[str, float] = {}
+        self._next_allowed: dict[str, float] = {}
+
+    async def acquire(self, domain: str) -> None:
+        """Wait until a request to domain is allowed, then reserve the slot."""
+        async with self._lock(domain):
+            wait = self._next_allowed.get(domain, 0.0) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            interval = self._intervals.get(domain, self._min_interval)
+            self._next_allowed[domain] = time.monotonic() + interval
+
+    def _lock(self, domain: str) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        entry = self._locks.get(domain)
+        if entry is None or entry[1]() is not loop:
+            entry = (asyncio.Lock(), weakref.ref(loop))
+            self._locks[domain] = entry
+        return entry[0]
+
+    def observe(self, domain: str, response: httpx.Response) -> None:
+        """Adapt the domain's gap from the response status and rate-limit headers."""
+        if response.status_code in (429, 503):
+            current = self._intervals.get(domain, self._min_interval)
+            interval = min(max(current * 2, self._min_interval), _MAX_RATE_LIMIT_DELAY)
+            self._intervals[domain] = interval
+            retry_after = _retry_after_seconds(response.headers.get("retry-after"))
+            delay = min(retry_after, _MAX_RATE_LIMIT_DELAY) if retry_after is not None else interval
+            self._next_allowed[domain] = max(
+                self._next_allowed.get(domain, 0.0), time.monotonic() + delay
+            )
+        elif response.is_success and domain in self._intervals:
+            self._intervals[domain] = max(self._intervals[domain] / 2, self._min_interval)
+
+
+def _retry_after_seconds(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds; HTTP-date values are ignored."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package (pip install 'httpx[http2]')."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@functools.cache
+def _default_client() -> httpx.Client:
+    """Process-wide client so sequential downloads reuse pooled connections (and TLS sessions)."""
+    client = httpx.Client(
+        http2=_http2_available(),
+        timeout=60.0,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    )
+    atexit.register(client.close)
+    return client
+
+
+@functools.cache
+def _default_rate_limiter() -> DomainRateLimiter:
+    """Process-wide limiter so separate async enrich calls keep pacing each host."""
+    return DomainRateLimiter()
+
+
+def _part_path(local_path: Path) -> Path:
+    """Temporary download path; renamed into place only once the download completes."""
+    return local_path.with_name(local_path.name + ".part")
+
+
+def _expected_size(resp: httpx.Response) -> int | None:
+    """Content-Length of the decoded body, when the server sent an unencoded one."""
+    if resp.headers.get("content-encoding", "identity") != "identity":
+        return None
+    try:
+        return int(resp.headers["content-length"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _finalize_download(tmp_path: Path, local_path: Path, expected_size: int | None) -> str | None:
+    """Move a completed download into place. Returns an error message if it was truncated."""
+    size = tmp_path.stat().st_size
+    if expected_size is not None and size != expected_size:
+        return f"Incomplete download ({size} of {expected_size} bytes)"
+    os.replace(tmp_path, local_path)
+    return None
+
+
+def _file_sha256(path: Path) -> str:
+    """SHA-256 of file contents, read in chunks."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+@functools.lru_cache(maxsize=8192)
 def _url_to_filename(url: str) -> str:
-    """Derive cache filename from URL."""
+    """
+    Derive cache filename from URL. Stays SHA-256 (not a faster hash) so files
+    already in existing caches keep resolving.
+    """
     h = hashlib.sha256(url.encode()).hexdigest()[:16]
     if url.lower().endswith(".pdf"):
         return f"{h}.pdf"
@@ -37,7 +168,9 @@ def fetch_attachment(
 ) -> tuple[Path | None, str | None]:
     """
     Download attachment to cache. Returns (local_path, error_message).
-    On success, error_message is None.
+    On success, error_message is None. The body is streamed to disk, not buffered in memory,
+    via a .part file that is renamed into place only when complete, so an interrupted
+    download never looks like a cached file.
     """
     cache_dir = Path(cache_dir)
     cache_dir.mkdir(parents=True, exist_ok=True)
@@ -56,15 +189,66 @@ def fetch_attachment(
             time.sleep(_RATE_LIMIT_DELAY - elapsed)
     _last_request_by_domain[domain] = time.monotonic()
 
-    client = client or httpx.Client(timeout=60.0, follow_redirects=True)
+    client = client or _default_client()
+    tmp_path = _part_path(local_path)
     try:
-        resp = client.get(url)
-        resp.raise_for_status()
-        local_path.write_bytes(resp.content)
+        with client.stream("GET", url) as resp:
+            resp.raise_for_status()
+            with open(tmp_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+                for chunk in resp.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+            err = _finalize_download(tmp_path, local_path, _expected_size(resp))
+        return (None, err) if err else (local_path, None)
+    except httpx.HTTPStatusError as e:
+        return (None, f"HTTP {e.response.status_code}")
+    except httpx.RequestError as e:
+        return (None, str(e))
+    except OSError as e:
+        return (None, str(e))
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+async def fetch_attachment_async(
+    url: str,
+    cache_dir: Path,
+    *,
+    client: httpx.AsyncClient,
+    rate_limiter: DomainRateLimiter | None = None,
+    skip_existing: bool = True,
+) -> tuple[Path | None, str | None]:
+    """
+    Async variant of fetch_attachment for concurrent downloads.
+    rate_limiter spaces requests per domain without blocking other hosts.
+    Concurrency limits are the caller's responsibility (see enrich_opportunity_async).
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    local_path = cache_dir / _url_to_filename(url)
+
+    if skip_existing and local_path.exists():
         return (local_path, None)
+
+    domain = _domain_from_url(url)
+    if rate_limiter:
+        await rate_limiter.acquire(domain)
+
+    tmp_path = _part_path(local_path)
+    try:
+        async with client.stream("GET", url) as resp:
+            if rate_limiter:
+                rate_limiter.observe(domain, resp)
+            resp.raise_for_status()
+            with open(tmp_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+                async for chunk in resp.aiter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+            err = _finalize_download(tmp_path, local_path, _expected_size(resp))
+        return (None, err) if err else (local_path, None)
     except httpx.HTTPStatusError as e:
         return (None, f"HTTP {e.response.status_code}")
     except httpx.RequestError as e:
         return (None, str(e))
     except OSError as e:
         return (None, str(e))
+    finally:
+        tmp_path.unlink(missing_ok=True)
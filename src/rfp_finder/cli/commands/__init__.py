@@ -0,0 +1,4 @@
+"""
+CLI subcommand handlers, one module per command, each exposing run(args).
+rfp_finder.cli.main imports only the module for the command being run.
+"""
@@ -0,0 +1,18 @@
+"""`rfp-finder enrich`: fetch and extract PDF attachments for open opportunities."""
+
+import argparse
+
+from rfp_finder.attachments import enrich_opportunities
+from rfp_finder.store import AttachmentCacheStore, OpportunityStore
+
+
+def run(args: argparse.Namespace) -> None:
+    """Run enrich command: fetch and extract PDF attachments for top opportunities."""
+    store = OpportunityStore(args.db)
+    opps = [o for o in store.get_by_status("open", limit=args.top) if o.attachments]
+    cache_store = AttachmentCacheStore(args.db)
+    cache_dir = args.cache_dir
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    texts = enrich_opportunities(opps, cache_dir, cache_store, fetch_missing=True)
+    enriched = sum(1 for text in texts if "[Attachment:" in text)
+    print(f"Enriched {enriched} opportunities with attachment text (cache: {cache_dir})")
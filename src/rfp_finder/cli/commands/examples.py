@@ -0,0 +1,30 @@
+"""`rfp-finder examples`: manage good/bad fit examples for AI scoring."""
+
+import argparse
+
+from rfp_finder.models.profile import UserProfile
+from rfp_finder.store import ExampleStore, OpportunityStore
+
+
+def run(args: argparse.Namespace) -> None:
+    """Run examples command."""
+    profile = UserProfile.from_yaml(args.profile)
+    ex_store = ExampleStore(args.db)
+
+    if args.action == "add":
+        if not args.url or not args.label:
+            raise SystemExit("examples add requires --url and --label")
+        ex = ex_store.add(profile.profile_id, args.url, args.label)
+        print(f"Added {args.label} example: {ex.url} (id={ex.id})")
+    elif args.action == "list":
+        for ex in ex_store.list_by_profile(profile.profile_id):
+            print(f"  [{ex.label}] {ex.url}")
+    elif args.action == "sync":
+        opp_store = OpportunityStore(args.db)
+        new_good = ex_store.filter_new_urls(profile.profile_id, profile.example_urls)
+        new_bad = ex_store.filter_new_urls(profile.profile_id, profile.bad_fit_urls)
+        good_set = set(new_good)
+        new_rows = [(url, "good") for url in new_good]
+        new_rows += [(url, "bad") for url in new_bad if url not in good_set]
+        added = ex_store.add_many(profile.profile_id, new_rows)
+        print(f"Synced {added} new examples from profile (good: {len(profile.example_urls)}, bad: {len(profile.bad_fit_urls)})")
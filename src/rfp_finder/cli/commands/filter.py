@@ -0,0 +1,93 @@
+"""`rfp-finder filter`: apply profile rules to stored or exported opportunities."""
+
+import argparse
+import sys
+from collections import Counter
+from collections.abc import Iterator
+
+from rfp_finder.cli.output import Record, _read_opportunities, _write_output
+from rfp_finder.filtering import FilterEngine
+from rfp_finder.models.profile import UserProfile
+
+
+def run(args: argparse.Namespace) -> None:
+    """
+    Run filter command. With --db, opportunities are streamed from the store, filtered
+    and written one at a time, so memory holds only passed ids and counts.
+    """
+    # Check for input before parsing the profile, so an empty store fails fast
+    store = None
+    if args.input:
+        opportunities = _read_opportunities(args.input)
+        total = len(opportunities)
+    else:
+        from rfp_finder.store import OpportunityStore
+
+        store = OpportunityStore(args.db)
+        total = store.count(args.status)
+
+    if not total:
+        print(
+            "No opportunities in store. Run ingest first:\n"
+            "  poetry run rfp-finder ingest --source canadabuys --store rfp_finder.db",
+            file=sys.stderr,
+        )
+        raise SystemExit(1)
+
+    profile = UserProfile.from_yaml(args.profile)
+    # Rejected opportunities' explanations are only ever shown with --show-explanations
+    engine = FilterEngine(profile, fast_reject=not args.show_explanations)
+    if store is not None:
+        # Rows outside the deadline window are skipped in SQL, unless every
+        # opportunity must be reported (explanations, per-rule stats)
+        report_all = args.show_explanations or getattr(args, "stats", False)
+        window = None if report_all else engine.closing_window()
+        opportunities = store.iter_opportunities(args.status, closing_window=window)
+
+    # Single pass: record passed ids and exclusion counts while streaming output
+    passed_ids: list[str] = []
+    reasons: Counter[str] = Counter()
+
+    def _records() -> Iterator[Record]:
+        for r in engine.filter_iter(opportunities):
+            if r.passed:
+                passed_ids.append(r.opportunity.id)
+            else:
+                reasons[r.excluded_by_rule or "other"] += 1
+            if args.show_explanations:
+                yield {
+                    "opportunity": r.opportunity.model_dump(mode="json"),
+                    "passed": r.passed,
+                    "eligibility": r.eligibility,
+                    "explanations": r.explanations,
+                }
+            elif r.passed:
+                yield r.opportunity
+
+    _write_output(_records(), args.output, getattr(args, "format", "json"))
+    if store is not None:
+        # Lets a following `score --db` skip re-filtering
+        store.put_filter_cache(store.filter_cache_key(profile, args.status), passed_ids)
+
+    if getattr(args, "stats", False):
+        _print_filter_stats(total, reasons)
+    if args.output:
+        print(f"Filtered: {len(passed_ids)} passed of {total} (wrote to {args.output})")
+
+
+def _exclusion_reasons(results: list) -> Counter[str]:
+    """Count excluded results by first-failing rule id (recorded by the engine)."""
+    return Counter(
+        getattr(r, "excluded_by_rule", None) or "other" for r in results if not r.passed
+    )
+
+
+def _print_filter_stats(total: int, reasons: Counter[str]) -> None:
+    """Print exclusion breakdown by first-failing rule."""
+    passed = total - reasons.total()
+    print(f"\n--- Filter stats: {passed}/{total} passed ---")
+    for rule, count in reasons.most_common():
+        pct = 100 * count / total
+        print(f"  Excluded by {rule}: {count} ({pct:.1f}%)")
+    if reasons:
+        print()
@@ -0,0 +1,59 @@
+"""`rfp-finder ingest`: fetch opportunities from a source, optionally into the store."""
+
+import argparse
+import sys
+
+from rfp_finder.cli.output import _write_output
+from rfp_finder.connectors.registry import ConnectorRegistry
+
+
+def run(args: argparse.Namespace) -> None:
+    """Run ingest command."""
+    connector_kwargs: dict = {}
+    if args.source == "bidsandtenders":
+        tenant = getattr(args, "tenant", None)
+        tenants = getattr(args, "tenants", None)
+        province = getattr(args, "province", None)
+        if tenant:
+            connector_kwargs["tenant"] = tenant
+        elif tenants:
+            connector_kwargs["tenants"] = [t.strip() for t in tenants.split(",") if t.strip()]
+        if province:
+            connector_kwargs["province"] = province
+
+    connector = ConnectorRegistry.get(args.source, **connector_kwargs)
+    since_dt = args.since
+
+    if args.incremental or since_dt:
+        opportunities = connector.fetch_incremental(since=since_dt)
+    else:
+        opportunities = connector.fetch_all()
+
+    if args.source == "bidsandtenders" and len(opportunities) == 0:
+        print(
+            "Note: No opportunities found. Try --tenant halifax or --tenants all for multi-tenant. "
+            "See: rfp-finder ingest --help",
+            file=sys.stderr,
+        )
+
+    store = None
+    run_record = None
+    if args.store is not None:
+        from rfp_finder.store import OpportunityStore
+
+        store = OpportunityStore(args.store)
+        run_record = store.start_run(args.source)
+
+    if store and run_record:
+        items_new, items_amended = store.upsert_many(opportunities)
+        store.finish_run(
+            run_record.id,
+            items_fetched=len(opportunities),
+            items_new=items_new,
+            items_amended=items_amended,
+        )
+        print(f"Store: {len(opportunities)} fetched, {items_new} new, {items_amended} amended")
+
+    written = _write_output(opportunities, args.output, getattr(args, "format", "json"))
+    if args.output:
+        print(f"Wrote {written} opportunities to {args.output}")
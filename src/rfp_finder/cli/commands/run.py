@@ -0,0 +1,39 @@
+"""`rfp-finder run`: full pipeline, filter then score."""
+
+import argparse
+import sys
+
+from rfp_finder.cli.commands.filter import _exclusion_reasons, _print_filter_stats
+from rfp_finder.cli.output import _write_output
+from rfp_finder.models.profile import UserProfile
+from rfp_finder.pipeline import run_pipeline
+
+
+def run(args: argparse.Namespace) -> None:
+    """Run full pipeline: filter → score."""
+    profile = UserProfile.from_yaml(args.profile)
+    show_stats = getattr(args, "stats", False)
+
+    result = run_pipeline(
+        profile=profile,
+        db_path=args.db,
+        status="open",
+        top_k=args.top,
+        enrich_top_n=getattr(args, "enrich_top", 5),
+        cache_dir=getattr(args, "cache_dir", None),
+        return_filter_results=show_stats,
+    )
+
+    if show_stats:
+        scored, filter_results = result
+        _print_filter_stats(len(filter_results), _exclusion_reasons(filter_results))
+    else:
+        scored = result
+
+    if not scored:
+        print("No opportunities passed filters.", file=sys.stderr)
+        raise SystemExit(1)
+
+    _write_output(scored, args.output, getattr(args, "format", "json"))
+    if args.output:
+        print(f"Scored {len(scored)} opportunities (wrote to {args.output})")
@@ -0,0 +1,52 @@
+"""`rfp-finder score`: AI relevance scoring of filtered opportunities."""
+
+import argparse
+import sys
+
+from rfp_finder.cli.output import _read_opportunities, _write_output
+from rfp_finder.models.profile import UserProfile
+from rfp_finder.scoring import score_opportunities
+from rfp_finder.store import AttachmentCacheStore, ExampleStore
+
+
+def run(args: argparse.Namespace) -> None:
+    """Run score command. When using --db, runs filter first to score only passed opportunities."""
+    profile = UserProfile.from_yaml(args.profile)
+    if args.input:
+        opportunities = _read_opportunities(args.input)
+    else:
+        from rfp_finder.filtering import FilterEngine
+        from rfp_finder.filtering.rules import apply_deadline_rule
+        from rfp_finder.store import OpportunityStore
+
+        store = OpportunityStore(args.db)
+        cache_key = store.filter_cache_key(profile, "open")
+        passed_ids = store.get_filter_cache(cache_key)
+        if passed_ids is not None:
+            # The cached verdicts may predate closings since then: re-check the deadline
+            opportunities = [
+                o for o in store.get_many(passed_ids) if apply_deadline_rule(o, profile)[0]
+            ]
+        else:
+            engine = FilterEngine(profile, fast_reject=True)
+            candidates = store.iter_opportunities("open", closing_window=engine.closing_window())
+            results = engine.filter_many_parallel(list(candidates))
+            opportunities = [r.opportunity for r in results if r.passed]
+            store.put_filter_cache(cache_key, [o.id for o in opportunities])
+    if not opportunities:
+        print("No opportunities to score.", file=sys.stderr)
+        raise SystemExit(1)
+    ex_store = ExampleStore(args.db)
+    cache_store = AttachmentCacheStore(args.db) if getattr(args, "enrich_top", 0) > 0 else None
+    scored = score_opportunities(
+        profile=profile,
+        opportunities=opportunities,
+        example_store=ex_store,
+        top_k=args.top,
+        enrich_top_n=getattr(args, "enrich_top", 0),
+        cache_dir=getattr(args, "cache_dir", None),
+        attachment_cache_store=cache_store,
+    )
+    _write_output(scored, args.output, getattr(args, "format", "json"))
+    if args.output:
+        print(f"Scored {len(scored)} opportunities (wrote to {args.output})")
@@ -0,0 +1,20 @@
+"""`rfp-finder store`: query the opportunity store."""
+
+import argparse
+
+from rfp_finder.cli.output import _write_json_lines, _write_output
+from rfp_finder.store import OpportunityStore
+
+
+def run(args: argparse.Namespace) -> None:
+    """Run store command."""
+    store = OpportunityStore(args.db)
+    if args.action == "list":
+        # Streams end to end: rows are read, converted and written one batch at a time
+        if getattr(args, "format", "json") == "jsonl":
+            # Rows are stored as each model's compact JSON: copy them out unparsed
+            _write_json_lines(store.iter_json(args.status), None)
+        else:
+            _write_output(store.iter_opportunities(args.status), None, "json")
+    elif args.action == "count":
+        print(store.count(args.status))
@@ -0,0 +1,18 @@
+"""`rfp-finder tenants`: list Bids & Tenders tenant subdomains."""
+
+import argparse
+
+from rfp_finder.connectors.bidsandtenders.tenants import TENANTS, get_tenant_subdomains
+
+
+def run(args: argparse.Namespace) -> None:
+    """List Bids & Tenders tenants."""
+    subdomains = get_tenant_subdomains(province=args.province, default_all=True)
+    for sub in subdomains:
+        ti = next((t for t in TENANTS.values() if t.subdomain == sub), None)
+        name = ti.name if ti else sub
+        prov = f" ({ti.province})" if ti and ti.province else ""
+        print(f"  {sub:25} {name}{prov}")
+    print(f"\nUse: rfp-finder ingest --source bidsandtenders --tenant <subdomain>")
+    print(f"     rfp-finder ingest --source bidsandtenders --tenants all")
+    print(f"     rfp-finder ingest --source bidsandtenders --province ON")
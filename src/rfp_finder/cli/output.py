@@ -0,0 +1,142 @@
+"""JSON output and input helpers shared by CLI commands."""
+
+import functools
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, TextIO, Union
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from rfp_finder.models.opportunity import NormalizedOpportunity
+
+# An output record: a JSON-ready dict, or a pydantic model dumped in JSON mode
+Record = Union[dict, "BaseModel"]
+
+# Output formats for commands that emit opportunity lists (json keeps the old indented array)
+_OUTPUT_FORMATS = ("json", "jsonl")
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+@functools.cache
+def _orjson():
+    """orjson module if installed, else None. Imported on first output, not at start-up."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _dumps(record: Record, indent: bool = False) -> str:
+    """
+    Serialize one record. Models go straight through their class's pydantic-core
+    serializer (no intermediate dict); dicts use orjson when installed (several times
+    faster) or json.
+    """
+    serializer = getattr(type(record), "__pydantic_serializer__", None)
+    if serializer is not None:
+        return serializer.to_json(record, indent=2 if indent else None).decode()
+    orjson = _orjson()
+    if orjson is not None:
+        # Passthrough keeps datetimes going through default=str, matching the json fallback
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        option |= orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(record, default=str, option=option).decode()
+    import json
+
+    return json.dumps(record, indent=2 if indent else None, default=str)
+
+
+def _stream_dump(records: Iterable[Record], fp: TextIO, fmt: str = "json") -> int:
+    """
+    Write records one at a time, never holding the whole serialized output in memory.
+    "json" output has the layout of json.dumps(list(records), indent=2). Returns record count.
+    """
+    count = 0
+    if fmt == "jsonl":
+        for record in records:
+            fp.write(_dumps(record))
+            fp.write("\n")
+            count += 1
+        return count
+    for record in records:
+        fp.write(",\n  " if count else "[\n  ")
+        fp.write(_dumps(record, indent=True).replace("\n", "\n  "))
+        count += 1
+    fp.write("\n]\n" if count else "[]\n")
+    return count
+
+
+def _write_output(records: Iterable[Record], output: Path | None, fmt: str = "json") -> int:
+    """Stream records to output file, or stdout when output is None. Returns record count."""
+    if output is None:
+        return _stream_dump(records, sys.stdout, fmt)
+    with output.open("w", encoding="utf-8", buffering=_OUTPUT_BUFFER_SIZE) as fp:
+        return _stream_dump(records, fp, fmt)
+
+
+def _copy_lines(lines: Iterable[str], fp: TextIO) -> int:
+    count = 0
+    for line in lines:
+        fp.write(line)
+        fp.write("\n")
+        count += 1
+    return count
+
+
+def _write_json_lines(lines: Iterable[str], output: Path | None) -> int:
+    """
+    Write already-serialized JSON objects as JSON Lines, without parsing or re-encoding
+    them, to output file or stdout. Returns record count.
+    """
+    if output is None:
+        return _copy_lines(lines, sys.stdout)
+    with output.open("w", encoding="utf-8", buffering=_OUTPUT_BUFFER_SIZE) as fp:
+        return _copy_lines(lines, fp)
+
+
+def _read_records(path: Path) -> list[dict]:
+    """
+    Read records written by _write_output: a JSON array or JSON Lines. Parses the raw
+    bytes with orjson when installed (no intermediate str), else json.
+    """
+    orjson = _orjson()
+    if orjson is not None:
+        loads = orjson.loads
+    else:
+        import json
+
+        loads = json.loads
+    data = path.read_bytes()
+    if data.lstrip().startswith(b"["):
+        return loads(data)
+    return [loads(line) for line in data.splitlines() if line.strip()]
+
+
+@functools.cache
+def _opportunity_list_adapter():
+    """TypeAdapter for list[NormalizedOpportunity], built on first use (imports pydantic)."""
+    from pydantic import TypeAdapter
+
+    from rfp_finder.models.opportunity import NormalizedOpportunity
+
+    return TypeAdapter(list[NormalizedOpportunity])
+
+
+def _read_opportunities(path: Path) -> list["NormalizedOpportunity"]:
+    """
+    Read opportunities written by _write_output (JSON array or JSON Lines), validating
+    straight from the raw bytes in pydantic-core: no intermediate dicts or json parse.
+    """
+    from rfp_finder.models.opportunity import NormalizedOpportunity
+
+    data = path.read_bytes()
+    if data.lstrip().startswith(b"["):
+        return _opportunity_list_adapter().validate_json(data)
+    return [
+        NormalizedOpportunity.model_validate_json(line)
+        for line in data.splitlines()
+        if line.strip()
+    ]
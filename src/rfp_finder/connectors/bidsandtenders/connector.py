@@ -10,8 +10,12 @@ This connector uses the same XHR flow as the web UI:
 3. The search GUID is ephemeral and must be extracted from the listing HTML
 """
 
+import importlib.util
 import logging
 import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -21,7 +25,12 @@ from rfp_finder.connectors.base import BaseConnector
 from rfp_finder.models.opportunity import NormalizedOpportunity
 from rfp_finder.models.raw import RawOpportunity
 
-from .parsers import extract_csrf_token, extract_search_guid, raw_from_search_item
+from .parsers import (
+    extract_csrf_token,
+    extract_search_guid,
+    parse_datetime,
+    raw_from_search_item,
+)
 from .tenants import (
     TENANTS,
     base_url_for_tenant,
@@ -31,6 +40,20 @@ from .tenants import (
 logger = logging.getLogger(__name__)
 
 
+def _query_haystack(data: dict) -> str:
+    """
+    Lowercased title, description and reference number for search(query=...), lowered
+    in one call; the NUL separator keeps a query from matching across two fields.
+    """
+    return "\x00".join(
+        (
+            data.get("title") or "",
+            data.get("description") or "",
+            data.get("reference_number") or "",
+        )
+    ).lower()
+
+
 class BidsTendersConnector(BaseConnector):
     """
     Connector for Bids & Tenders (bidsandtenders.ca).
@@ -42,6 +65,13 @@ class BidsTendersConnector(BaseConnector):
 
     LISTING_PATH = "/module/tenders/en/"
     SEARCH_PATH_TEMPLATE = "/Module/Tenders/en/Tender/Search/{guid}"
+    DETAIL_PATH = "/Module/Tenders/en/Tender/Detail/"
+    # Result pages requested at once per tenant (after the first, which reports the total)
+    MAX_CONCURRENT_PAGES = 8
+    # Tenants searched at once by iter_search/search
+    MAX_CONCURRENT_TENANTS = 8
+    # Seconds a bootstrapped (token, guid) is reused by later searches of the same tenant
+    SESSION_TTL = 600.0
 
     DEFAULT_HEADERS = {
         "User-Agent": "Mozilla/5.0 (compatible; rfp-finder/0.1; Canadian RFP finder)",
@@ -57,6 +87,7 @@ class BidsTendersConnector(BaseConnector):
         province: Optional[str] = None,
         base_url: Optional[str] = None,
         client: Optional[httpx.Client] = None,
+        keep_raw: Optional[bool] = None,
     ):
         """
         Args:
@@ -65,13 +96,36 @@ class BidsTendersConnector(BaseConnector):
             province: Two-letter province code to filter tenants (e.g. ON, BC)
             base_url: Override base URL for single-tenant (legacy; use tenant instead)
             client: Optional httpx client
+            keep_raw: Keep each search item's full JSON under raw.data["_raw"]
+                (default: BIDS_TENDERS_KEEP_RAW=1 in the environment)
         """
+        # Enough HTTP/1.1 connections for every concurrent page request across tenants,
+        # all kept alive so a tenant's bootstrap connection is reused by its searches
+        max_connections = self.MAX_CONCURRENT_TENANTS * self.MAX_CONCURRENT_PAGES
         self._client = client or httpx.Client(
-            timeout=30.0,
+            # One multiplexed connection per tenant when h2 is installed (http2 extra)
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=httpx.Timeout(30.0, connect=5.0),
             follow_redirects=True,
             headers=self.DEFAULT_HEADERS,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=30.0,
+            ),
         )
 
+        # base_url -> headers for _post_search (built once per tenant)
+        self._search_headers: dict[str, dict[str, str]] = {}
+        # base_url -> (monotonic time, token, guid) from _bootstrap
+        self._sessions: dict[str, tuple[float, str, str]] = {}
+        # Listing crawled by fetch_details, per tenant (see _details_index)
+        self._details_indexes: dict[str, dict[str, RawOpportunity]] = {}
+
+        if keep_raw is None:
+            keep_raw = os.environ.get("BIDS_TENDERS_KEEP_RAW") == "1"
+        self._keep_raw = keep_raw
+
         env_base = os.environ.get("BIDS_TENDERS_BASE_URL") if not base_url else None
         base_url = base_url or env_base
 
@@ -96,10 +150,17 @@ class BidsTendersConnector(BaseConnector):
             return [env_tenant.strip()]
         return None
 
+    def _cached_session(self, base_url: str) -> Optional[tuple[str, str]]:
+        """(token, guid) from an earlier _bootstrap of base_url, if younger than SESSION_TTL."""
+        cached = self._sessions.get(base_url)
+        if cached and time.monotonic() - cached[0] < self.SESSION_TTL:
+            return cached[1], cached[2]
+        return None
+
     def _bootstrap(self, base_url: str) -> tuple[str, str]:
         """
         Fetch listing page for a tenant, extract CSRF token and search GUID.
-        Returns (token, guid).
+        Returns (token, guid), remembered for _cached_session.
         """
         url = base_url + self.LISTING_PATH
         resp = self._client.get(url)
@@ -113,6 +174,7 @@ class BidsTendersConnector(BaseConnector):
                 "Could not find search GUID in listing page. "
                 "The site may have changed its structure."
             )
+        self._sessions[base_url] = (time.monotonic(), token, guid)
         return token, guid
 
     def _post_search(
@@ -136,11 +198,13 @@ class BidsTendersConnector(BaseConnector):
             "to": "",
             "sort": "DateClosing ASC,Id",
         }
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-            "Origin": base_url,
-            "Referer": base_url + "/",
-        }
+        headers = self._search_headers.get(base_url)
+        if headers is None:
+            headers = self._search_headers[base_url] = {
+                "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+                "Origin": base_url,
+                "Referer": base_url + "/",
+            }
         data = {"__RequestVerificationToken": token}
 
         resp = self._client.post(url, params=params, data=data, headers=headers)
@@ -168,21 +232,30 @@ class BidsTendersConnector(BaseConnector):
         filters: Optional[dict] = None,
     ) -> list[RawOpportunity]:
         """Search one tenant and return raw list with tenant tag."""
+        return list(self._iter_single_tenant(tenant, base_url, query, filters))
+
+    def _iter_single_tenant(
+        self,
+        tenant: str,
+        base_url: str,
+        query: Optional[str] = None,
+        filters: Optional[dict] = None,
+    ) -> Iterator[RawOpportunity]:
+        """Search one tenant, yielding raw records (with tenant tag) page by page."""
+        cached = self._cached_session(base_url)
         try:
-            token, guid = self._bootstrap(base_url)
+            token, guid = cached or self._bootstrap(base_url)
         except Exception as e:
             logger.warning("Bootstrap failed for %s: %s", tenant, e)
-            return []
+            return
 
         status = (filters or {}).get("status", "Open")
         limit = (filters or {}).get("limit", 25)
         max_results = (filters or {}).get("max_results")
+        q = query.lower() if query else None
 
-        all_raw: list[RawOpportunity] = []
-        start = 0
-        total_seen = 0
-
-        while True:
+        def _page(start: int) -> Optional[dict]:
+            """Search payload for the page at start, or None when the request fails."""
             try:
                 payload = self._post_search(
                     base_url, token, guid,
@@ -192,42 +265,92 @@ class BidsTendersConnector(BaseConnector):
                 )
             except Exception as e:
                 logger.warning("Search failed for %s (start=%d): %s", tenant, start, e)
-                break
-
+                return None
             if not payload.get("success"):
                 logger.warning("Search returned success=false for %s: %s", tenant, payload)
-                break
+                return None
+            return payload
 
-            data_list = payload.get("data") or []
-            total = payload.get("total", 0)
+        detail_prefix = base_url + self.DETAIL_PATH
+        # A complete, unfiltered listing doubles as the fetch_details index (_details_index)
+        index: Optional[dict[str, RawOpportunity]] = {} if q is None and not filters else None
 
+        def _raws(data_list: list) -> Iterator[RawOpportunity]:
             for item in data_list:
-                raw_data = raw_from_search_item(item)
+                raw_data = raw_from_search_item(item, self._keep_raw)
                 raw_data["_tenant"] = tenant
                 if not raw_data.get("url") and raw_data.get("id"):
-                    raw_data["url"] = (
-                        f"{base_url}/Module/Tenders/en/Tender/Detail/{raw_data['id']}"
-                    )
-                all_raw.append(RawOpportunity(data=raw_data))
-
-            total_seen += len(data_list)
-            if not data_list or total_seen >= total:
-                break
-            start += limit
-            if max_results is not None and total_seen >= max_results:
-                break
-
-        if query:
-            q = query.lower()
-            all_raw = [
-                r
-                for r in all_raw
-                if q in (r.data.get("title") or "").lower()
-                or q in (r.data.get("description") or "").lower()
-                or q in (r.data.get("reference_number") or "").lower()
-            ]
-
-        return all_raw
+                    raw_data["url"] = detail_prefix + str(raw_data["id"])
+                if q is None or q in _query_haystack(raw_data):
+                    raw = RawOpportunity.from_dict(raw_data)
+                    if index is not None and (key := self._details_key(raw)):
+                        index.setdefault(key, raw)
+                    yield raw
+
+        # The first page reports the total; the remaining pages are independent, so they
+        # are fetched concurrently on the shared client (same session cookies), in order
+        first = _page(0)
+        if first is None and cached:
+            # The server may have expired the reused session: bootstrap afresh, retry once
+            self._sessions.pop(base_url, None)
+            try:
+                token, guid = self._bootstrap(base_url)
+            except Exception as e:
+                logger.warning("Bootstrap failed for %s: %s", tenant, e)
+                return
+            first = _page(0)
+        if first is None:
+            return
+        first_data = first.get("data") or []
+        yield from _raws(first_data)
+        total = first.get("total", 0)
+        wanted = total if max_results is None else min(total, max_results)
+        # The index is cached only if it holds the tenant's whole listing
+        complete = wanted == total and (bool(first_data) or total == 0)
+        starts = range(limit, wanted, limit)
+        if first_data and starts:
+            pool = ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_PAGES, len(starts)))
+            try:
+                for payload in pool.map(_page, starts):
+                    # Stop at the first failed or empty page, as the serial loop did
+                    if payload is None or not payload.get("data"):
+                        complete = False
+                        break
+                    yield from _raws(payload["data"])
+            finally:
+                # A consumer that stops early skips the pages not yet requested
+                pool.shutdown(cancel_futures=True)
+        # Only reached when the consumer took every record
+        if index is not None and complete:
+            self._details_indexes[tenant] = index
+
+    def iter_search(
+        self,
+        query: Optional[str] = None,
+        filters: Optional[dict] = None,
+    ) -> Iterator[RawOpportunity]:
+        """
+        Like search, but yields records as they arrive instead of collecting them. A single
+        tenant streams page by page; several tenants are searched concurrently (each one
+        whole, still yielded in tenant order), so a multi-tenant search costs about one
+        tenant's round trips rather than the sum of them.
+        """
+        if len(self._base_urls) <= 1:
+            for tenant, base_url in self._base_urls:
+                yield from self._iter_single_tenant(tenant, base_url, query, filters)
+            return
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.MAX_CONCURRENT_TENANTS, len(self._base_urls))
+        )
+        try:
+            # _search_single_tenant logs and swallows per-tenant failures
+            for raws in pool.map(
+                lambda t: self._search_single_tenant(t[0], t[1], query, filters),
+                self._base_urls,
+            ):
+                yield from raws
+        finally:
+            pool.shutdown(cancel_futures=True)
 
     def search(
         self,
@@ -238,11 +361,7 @@ class BidsTendersConnector(BaseConnector):
         Search opportunities across configured tenant(s).
         Supports pagination by fetching all pages when limit/start not specified.
         """
-        all_raw: list[RawOpportunity] = []
-        for tenant, base_url in self._base_urls:
-            raw_list = self._search_single_tenant(tenant, base_url, query, filters)
-            all_raw.extend(raw_list)
-        return all_raw
+        return list(self.iter_search(query, filters))
 
     def fetch_details(self, raw_id: str) -> RawOpportunity:
         """
@@ -264,13 +383,33 @@ class BidsTendersConnector(BaseConnector):
                 raise ValueError(f"Unknown tenant: {tenant_hint}")
 
         for tenant, base_url in base_urls:
-            for r in self._search_single_tenant(tenant, base_url):
-                sid = r.data.get("id") or r.data.get("reference_number")
-                if sid and str(sid).strip() == str(id_part).strip():
-                    return r
+            found = self._details_index(tenant, base_url).get(str(id_part).strip())
+            if found is not None:
+                return found
 
         raise ValueError(f"Opportunity not found: {raw_id}")
 
+    def _details_index(self, tenant: str, base_url: str) -> dict[str, RawOpportunity]:
+        """
+        id -> raw for one tenant's listing, crawled once per connector instance, so N
+        fetch_details calls cost one crawl instead of N (there is no per-id endpoint).
+        A full search of the tenant earlier on this instance counts as that crawl.
+        """
+        index = self._details_indexes.get(tenant)
+        if index is None:
+            index = {}
+            for r in self._search_single_tenant(tenant, base_url):
+                if key := self._details_key(r):
+                    index.setdefault(key, r)
+            self._details_indexes[tenant] = index
+        return index
+
+    @staticmethod
+    def _details_key(raw: RawOpportunity) -> Optional[str]:
+        """fetch_details lookup key for a raw record: its id, else its reference number."""
+        sid = raw.data.get("id") or raw.data.get("reference_number")
+        return str(sid).strip() if sid else None
+
     def normalize(self, raw: RawOpportunity) -> NormalizedOpportunity:
         """Convert raw record to NormalizedOpportunity."""
         d = raw.data
@@ -288,7 +427,7 @@ class BidsTendersConnector(BaseConnector):
             url=(d.get("url") or "").strip() or None,
             buyer=(d.get("buyer") or d.get("contracting_entity") or "").strip() or None,
             buyer_id=None,
-            published_at=None,
+            published_at=parse_datetime(d.get("date_published")),
             closing_at=None,
             amended_at=None,
             categories=[],
@@ -307,15 +446,24 @@ class BidsTendersConnector(BaseConnector):
         )
 
     def fetch_all(self) -> list[NormalizedOpportunity]:
-        """Fetch all open opportunities across tenant(s) and return normalized list."""
-        return [self.normalize(r) for r in self.search()]
+        """
+        Fetch all open opportunities across tenant(s) and return normalized list.
+        Raw records are normalized as pages arrive, so they are never all held at once.
+        """
+        return [self.normalize(r) for r in self.iter_search()]
 
     def fetch_incremental(self, since: Optional[datetime] = None) -> list[NormalizedOpportunity]:
-        """Fetch opportunities; filter by since if provided (client-side)."""
-        all_opps = self.fetch_all()
+        """
+        Fetch opportunities; filter by since if provided (client-side, on the raw publication
+        date, so records that are dropped are never normalized).
+        """
         if since is None:
-            return all_opps
-        return [o for o in all_opps if o.published_at and o.published_at >= since]
+            return self.fetch_all()
+        return [
+            self.normalize(r)
+            for r in self.iter_search()
+            if (published := parse_datetime(r.data.get("date_published"))) and published >= since
+        ]
 
     @classmethod
     def list_tenants(cls) -> dict[str, str]:
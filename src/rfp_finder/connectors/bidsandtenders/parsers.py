@@ -1,30 +1,46 @@
 """Parsers for Bids & Tenders HTML and JSON responses."""
 
 import re
+from datetime import datetime, timezone
 from typing import Optional
 
 
+# Compiled once at import; tried in order, first match wins
+_CSRF_TOKEN_RES = (
+    re.compile(r'name="__RequestVerificationToken"[^>]*value="([^"]+)"', re.IGNORECASE),
+    # Alternate: value before name
+    re.compile(r'value="([^"]+)"[^>]*name="__RequestVerificationToken"', re.IGNORECASE),
+)
+_SEARCH_GUID_RES = (
+    # Primary: NodeId hidden input (used by index.js)
+    re.compile(r'id="NodeId"[^>]*value="([0-9a-fA-F-]{36})"', re.IGNORECASE),
+    re.compile(r'value="([0-9a-fA-F-]{36})"[^>]*id="NodeId"', re.IGNORECASE),
+    # Fallback: /Tender/Search/{guid} in URLs
+    re.compile(r"/Tender/Search/([0-9a-fA-F-]{36})"),
+)
+
+
+# ASP.NET JSON date, e.g. "/Date(1767225600000)/" or "/Date(1767225600000-0500)/"
+_ASPNET_DATE_RE = re.compile(r"/Date\((-?\d+)(?:[+-]\d{4})?\)/")
+
+
+def _first_group(patterns: tuple[re.Pattern[str], ...], html: str) -> Optional[str]:
+    for pattern in patterns:
+        m = pattern.search(html)
+        if m:
+            return m.group(1)
+    return None
+
+
 def extract_csrf_token(html: str) -> str:
     """
     Extract __RequestVerificationToken from listing page HTML.
     ASP.NET MVC uses this for CSRF protection.
     """
     # Prefer regex for minimal dependency; markup may vary
-    m = re.search(
-        r'name="__RequestVerificationToken"[^>]*value="([^"]+)"',
-        html,
-        re.IGNORECASE,
-    )
-    if m:
-        return m.group(1)
-    # Alternate: value before name
-    m = re.search(
-        r'value="([^"]+)"[^>]*name="__RequestVerificationToken"',
-        html,
-        re.IGNORECASE,
-    )
-    if m:
-        return m.group(1)
+    token = _first_group(_CSRF_TOKEN_RES, html)
+    if token:
+        return token
     raise RuntimeError(
         "Could not find __RequestVerificationToken in listing page HTML."
     )
@@ -36,33 +52,14 @@ def extract_search_guid(html: str) -> Optional[str]:
     The site uses id="NodeId" value="{guid}" for the Search endpoint.
     Fallback: look for /Tender/Search/{guid} in URLs.
     """
-    # Primary: NodeId hidden input (used by index.js)
-    m = re.search(
-        r'id="NodeId"[^>]*value="([0-9a-fA-F-]{36})"',
-        html,
-        re.IGNORECASE,
-    )
-    if m:
-        return m.group(1)
-    m = re.search(
-        r'value="([0-9a-fA-F-]{36})"[^>]*id="NodeId"',
-        html,
-        re.IGNORECASE,
-    )
-    if m:
-        return m.group(1)
-    # Fallback: /Tender/Search/{guid} in URLs
-    m = re.search(
-        r"/Tender/Search/([0-9a-fA-F-]{36})",
-        html,
-    )
-    return m.group(1) if m else None
+    return _first_group(_SEARCH_GUID_RES, html)
 
 
-def raw_from_search_item(item: dict) -> dict:
+def raw_from_search_item(item: dict, keep_raw: bool = False) -> dict:
     """
     Map a single item from the Search JSON response to our raw data shape.
-    Field names may vary; use flexible lookups.
+    Field names may vary; use flexible lookups. keep_raw also stores the whole
+    item under "_raw" (for debugging field mapping; absent by default).
     """
     # Common ASP.NET/JS naming patterns
     raw: dict = {}
@@ -121,6 +118,26 @@ def raw_from_search_item(item: dict) -> dict:
         or item.get("PublicationDate")
         or item.get("publication_date")
     )
-    # Preserve full item for debugging and future field mapping
-    raw["_raw"] = item
+    if keep_raw:
+        raw["_raw"] = item
     return raw
+
+
+def parse_datetime(value: object) -> Optional[datetime]:
+    """
+    Parse a Search JSON date: ISO 8601 text or an ASP.NET "/Date(ms)/" literal.
+    Returns naive UTC (the convention CanadaBuys dates and --since use); None if unparseable.
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    m = _ASPNET_DATE_RE.fullmatch(value)
+    if m:
+        return datetime.fromtimestamp(int(m.group(1)) / 1000, timezone.utc).replace(tzinfo=None)
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
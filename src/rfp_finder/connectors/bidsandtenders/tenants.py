@@ -74,6 +74,13 @@ TENANTS: dict[str, TenantInfo] = {
 }
 # fmt: on
 
+# Registry views for get_tenant_subdomains, built once at import (TENANTS is static)
+_ALL_SUBDOMAINS: tuple[str, ...] = tuple(ti.subdomain for ti in TENANTS.values())
+_SUBDOMAINS_BY_PROVINCE: dict[Optional[str], list[str]] = {}
+for _ti in TENANTS.values():
+    _SUBDOMAINS_BY_PROVINCE.setdefault(_ti.province, []).append(_ti.subdomain)
+del _ti
+
 
 def get_tenant_subdomains(
     tenants: Optional[list[str]] = None,
@@ -90,7 +97,7 @@ def get_tenant_subdomains(
     """
     if tenants:
         if "all" in tenants or "*" in [t.strip().lower() for t in tenants]:
-            return [ti.subdomain for ti in TENANTS.values()]
+            return list(_ALL_SUBDOMAINS)
         subdomains: list[str] = []
         for t in tenants:
             key = t.lower().replace("_", "-").strip()
@@ -101,11 +108,10 @@ def get_tenant_subdomains(
         return subdomains
 
     if province:
-        prov = province.upper()
-        return [ti.subdomain for ti in TENANTS.values() if ti.province == prov]
+        return list(_SUBDOMAINS_BY_PROVINCE.get(province.upper(), ()))
 
     if default_all:
-        return [ti.subdomain for ti in TENANTS.values()]
+        return list(_ALL_SUBDOMAINS)
     return ["bids"]  # Backward compat: shared tenant only
 
 
@@ -1,8 +1,11 @@
 """CanadaBuys connector using official open data CSV files."""
 
+import atexit
 import csv
+import functools
+import importlib.util
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
-from io import StringIO
 from typing import Optional
 from urllib.parse import urljoin
 
@@ -59,21 +62,64 @@ class CanadaBuysConnector(BaseConnector):
     }
 
     def __init__(self, client: Optional[httpx.Client] = None):
-        self._client = client or httpx.Client(
-            timeout=60.0,
-            follow_redirects=True,
-            headers=self.DEFAULT_HEADERS,
-        )
+        self._client = client or _shared_client()
 
-    def _fetch_csv(self, url: str) -> str:
-        """Fetch CSV content from URL."""
-        response = self._client.get(url)
-        response.raise_for_status()
-        return response.text
+    def _iter_csv_lines(self, url: str) -> Iterator[str]:
+        """
+        Stream CSV text from URL, one line (with its newline) at a time, so the file is
+        never held in memory whole. Newlines are kept because quoted fields may span lines.
+        """
+        with self._client.stream("GET", url) as response:
+            response.raise_for_status()
+            pending = ""
+            for chunk in response.iter_text():
+                lines = (pending + chunk).split("\n")
+                pending = lines.pop()
+                for line in lines:
+                    yield line + "\n"
+            if pending:
+                yield pending
 
-    def _parse_csv_rows(self, csv_content: str) -> list[dict[str, str]]:
-        """Parse CSV with proper handling of quoted multiline fields."""
-        return list(csv.DictReader(StringIO(csv_content)))
+    def _parse_csv_rows(
+        self, lines: Iterable[str], query: Optional[str] = None
+    ) -> Iterator[dict[str, str]]:
+        """
+        Parse CSV lines (quoted multiline fields included) into rows keyed by header, as
+        csv.DictReader would. With query, rows whose title and description both miss it
+        are skipped from their column values, before a dict is built for them.
+        """
+        reader = csv.reader(lines)
+        fieldnames = next(reader, None)
+        if fieldnames is None:
+            return
+        n = len(fieldnames)
+        q = query.lower() if query else None
+        query_cols = [
+            i for i, name in enumerate(fieldnames) if name in (TITLE_ENG, DESCRIPTION_ENG)
+        ]
+        for row in reader:
+            if not row:
+                continue
+            if q is not None and not any(i < len(row) and q in row[i].lower() for i in query_cols):
+                continue
+            d = dict(zip(fieldnames, row))
+            # Ragged rows: same restval/restkey handling as csv.DictReader
+            if len(row) > n:
+                d[None] = row[n:]
+            elif len(row) < n:
+                d.update(dict.fromkeys(fieldnames[len(row) :]))
+            yield d
+
+    def iter_search(
+        self,
+        query: Optional[str] = None,
+        filters: Optional[dict] = None,
+    ) -> Iterator[RawOpportunity]:
+        """Like search, but yields records as the CSV streams in instead of collecting them."""
+        source = (filters or {}).get("source", "open")
+        url = self.NEW_TENDERS_CSV if source == "new" else self.OPEN_TENDERS_CSV
+        for row in self._parse_csv_rows(self._iter_csv_lines(url), query):
+            yield RawOpportunity.from_dict(row)
 
     def search(
         self,
@@ -85,28 +131,15 @@ class CanadaBuysConnector(BaseConnector):
         query: optional keyword filter (applied client-side to title/summary)
         filters: optional dict with 'source' key: 'open' | 'new' (default: 'open')
         """
-        source = (filters or {}).get("source", "open")
-        url = self.NEW_TENDERS_CSV if source == "new" else self.OPEN_TENDERS_CSV
-        content = self._fetch_csv(url)
-        rows = self._parse_csv_rows(content)
-        raw_list = [RawOpportunity(data=dict(row)) for row in rows]
-
-        if query:
-            q = query.lower()
-            raw_list = [
-                r
-                for r in raw_list
-                if q in (r.data.get(TITLE_ENG) or "").lower()
-                or q in (r.data.get(DESCRIPTION_ENG) or "").lower()
-            ]
-        return raw_list
+        return list(self.iter_search(query, filters))
 
     def fetch_details(self, raw_id: str) -> RawOpportunity:
         """
         Fetch one opportunity by reference number.
         CanadaBuys CSV has no per-item fetch; we search and filter.
         """
-        for r in self.search(filters={"source": "open"}):
+        # Stops downloading as soon as the row is found
+        for r in self.iter_search(filters={"source": "open"}):
             ref = r.data.get(REFERENCE_NUMBER)
             if ref and ref.strip() == raw_id.strip():
                 return r
@@ -128,7 +161,12 @@ class CanadaBuysConnector(BaseConnector):
         """Extract and normalize notice URL."""
         url = (d.get(NOTICE_URL_ENG) or "").strip() or None
         if url and not url.startswith("http"):
-            url = urljoin(self.BASE_URL, url)
+            # Site-absolute paths (the usual relative form) just need the origin;
+            # urljoin handles the rest (protocol-relative, "../", bare paths)
+            if url.startswith("/") and not url.startswith("//"):
+                url = self.BASE_URL + url
+            else:
+                url = urljoin(self.BASE_URL, url)
         return url
 
     def _get_categories(self, d: dict[str, str]) -> list[str]:
@@ -203,15 +241,33 @@ class CanadaBuysConnector(BaseConnector):
         )
 
     def fetch_all(self) -> list[NormalizedOpportunity]:
-        """Fetch all open tenders and return normalized list."""
-        return [self.normalize(r) for r in self.search(filters={"source": "open"})]
+        """Fetch all open tenders and return normalized list, normalizing rows as they stream in."""
+        return [self.normalize(r) for r in self.iter_search(filters={"source": "open"})]
 
     def fetch_incremental(self, since: Optional[datetime] = None) -> list[NormalizedOpportunity]:
         """
         Fetch new tenders only (uses new tenders CSV, smaller file).
         If since is provided, also filter by publication date.
         """
-        normalized = [self.normalize(r) for r in self.search(filters={"source": "new"})]
+        normalized = [self.normalize(r) for r in self.iter_search(filters={"source": "new"})]
         if since:
             normalized = [o for o in normalized if o.published_at and o.published_at >= since]
         return normalized
+
+
+@functools.cache
+def _shared_client() -> httpx.Client:
+    """
+    Pooled client shared by every CanadaBuysConnector without an injected one, so
+    connections to canadabuys.canada.ca stay alive across instances in one process.
+    """
+    client = httpx.Client(
+        # Multiplexed when h2 is installed (http2 extra)
+        http2=importlib.util.find_spec("h2") is not None,
+        timeout=60.0,
+        follow_redirects=True,
+        headers=CanadaBuysConnector.DEFAULT_HEADERS,
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=30.0),
+    )
+    atexit.register(client.close)
+    return client
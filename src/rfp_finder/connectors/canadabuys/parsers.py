@@ -1,5 +1,6 @@
 """Parsing utilities for CanadaBuys CSV data."""
 
+import functools
 import hashlib
 import json
 import re
@@ -35,8 +36,9 @@ _REGION_MAP: list[tuple[str, str]] = [
 ]
 
 
+@functools.lru_cache(maxsize=1024)
 def normalize_region(region: Optional[str]) -> Optional[str]:
-    """Map CanadaBuys region string to clean province code or National."""
+    """Map CanadaBuys region string to clean province code or National (cached; feeds repeat)."""
     if not region or not region.strip():
         return None
     r = region.lower().strip().replace("*", "")
@@ -71,16 +73,36 @@ DATE_FORMATS = ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d", "%Y/%m/%d")
 URL_PATTERN = re.compile(r"https?://[^\s,)\]\"']+", re.IGNORECASE)
 # Split concatenated URLs: "url1,url2" or "url1, url2" or "url1https://url2"
 URL_SEP = re.compile(r",\s*(?=https?://)", re.IGNORECASE)
+# Boundary before each "http(s)://" in concatenated URLs without separator
+_URL_START = re.compile(r"(?=https?://)", re.IGNORECASE)
+_PARAGRAPH_SEP = re.compile(r"\r?\n\r?\n")
+_TRADE_AGREEMENT_SEP = re.compile(r"[\n*]+")
 
 
 def parse_date(value: Optional[str]) -> Optional[datetime]:
     """Parse date string from CanadaBuys format."""
     if not value or not value.strip():
         return None
-    value = value.strip()
+    return _parse_date_cached(value.strip()[:19])
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_date_cached(value: str) -> Optional[datetime]:
+    """
+    parse_date for a stripped, truncated value; cached because rows share a few hundred
+    distinct dates (datetimes are immutable, so sharing them is safe).
+    """
+    # The feed's two shapes, YYYY-MM-DD and YYYY-MM-DDTHH:MM:SS, parse in C via
+    # fromisoformat (several times faster than strptime); anything else goes the slow way
+    iso_shape = len(value) == 10 or (len(value) == 19 and value[10] == "T")
+    if iso_shape and value[4] == value[7] == "-":
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
     for fmt in DATE_FORMATS:
         try:
-            return datetime.strptime(value[:19], fmt)
+            return datetime.strptime(value, fmt)
         except (ValueError, TypeError):
             continue
     return None
@@ -93,9 +115,9 @@ def derive_title_from_summary(summary: Optional[str]) -> str:
     """
     if not summary or not summary.strip():
         return "Untitled"
-    paragraphs = re.split(r"\r?\n\r?\n", summary.strip())
+    paragraphs = _PARAGRAPH_SEP.split(summary.strip())
     for para in paragraphs:
-        para = re.sub(r"&nbsp;", " ", para).strip()
+        para = para.replace("&nbsp;", " ").strip()
         for prefix in _TITLE_SKIP_PREFIXES:
             if para.upper().startswith(prefix.upper()):
                 para = para[len(prefix) :].strip().lstrip(":").strip()
@@ -133,7 +155,7 @@ def extract_attachments(attachment_field: Optional[str]) -> list[AttachmentRef]:
     # Split by comma when followed by http (preserves commas in query params)
     for segment in URL_SEP.split(attachment_field):
         # Also split concatenated URLs without separator: "url1https://url2"
-        subsegments = re.split(r"(?=https?://)", segment, flags=re.IGNORECASE)
+        subsegments = _URL_START.split(segment)
         for sub in subsegments:
             for url in URL_PATTERN.findall(sub):
                 add_url(url)
@@ -144,8 +166,20 @@ def parse_trade_agreements(value: Optional[str]) -> Optional[list[str]]:
     """Parse trade agreements from newline/asterisk-separated field."""
     if not value or not value.strip():
         return None
-    items = [s.strip() for s in re.split(r"[\n*]+", value) if s.strip()]
-    return items if items else None
+    items = _split_trade_agreements(value)
+    # A fresh list per call: the cached tuple is shared between rows
+    return list(items) if items else None
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_trade_agreements(value: str) -> tuple[str, ...]:
+    """Cached split for parse_trade_agreements; feeds repeat a few agreement lists."""
+    return tuple(s.strip() for s in _TRADE_AGREEMENT_SEP.split(value) if s.strip())
+
+
+# Same output as json.dumps(..., sort_keys=True), which stored hashes were computed with,
+# without rebuilding an encoder per call
+_HASH_ENCODER = json.JSONEncoder(sort_keys=True)
 
 
 def content_hash(raw: RawOpportunity) -> str:
@@ -157,4 +191,4 @@ def content_hash(raw: RawOpportunity) -> str:
         raw.data.get(AMENDMENT_DATE),
         raw.data.get(ATTACHMENTS_ENG),
     )
-    return hashlib.sha256(json.dumps(key_fields, sort_keys=True).encode()).hexdigest()
+    return hashlib.sha256(_HASH_ENCODER.encode(key_fields).encode()).hexdigest()
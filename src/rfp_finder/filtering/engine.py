@@ -1,6 +1,10 @@
 """Filter engine with pluggable rules and explanation trail."""
 
-from datetime import datetime, timezone
+import functools
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Callable, Optional
 
 from pydantic import BaseModel, Field
@@ -9,6 +13,7 @@ from rfp_finder.models.opportunity import NormalizedOpportunity
 from rfp_finder.models.profile import UserProfile
 
 from .rules import (
+    ProfileTerms,
     apply_budget_rule,
     apply_deadline_rule,
     apply_eligibility_rule,
@@ -32,6 +37,15 @@ class FilterResult(BaseModel):
 
 RuleFn = Callable[[NormalizedOpportunity, UserProfile], tuple[bool, str, str]]
 
+# filter_many_parallel: below _MIN_PARALLEL_ITEMS, pickling opportunities to workers costs
+# about as much as filtering them in-process, so it stays sequential
+_MIN_PARALLEL_ITEMS = 5_000
+_PARALLEL_CHUNK_SIZE = 1_000
+_MAX_WORKERS = 8
+
+# Engine of the current pool worker process, set once by _init_worker
+_worker_engine: Optional["FilterEngine"] = None
+
 
 class FilterEngine:
     """
@@ -40,15 +54,38 @@ class FilterEngine:
     eligibility is separate (unknown does not exclude).
     """
 
-    def __init__(self, profile: UserProfile):
+    def __init__(self, profile: UserProfile, *, fast_reject: bool = False):
+        """
+        fast_reject: stop at the first failing hard rule and skip the eligibility check
+        for excluded opportunities. Passed results are unchanged; excluded ones keep
+        excluded_by_rule but carry only that rule's explanation and eligibility "unknown".
+        For callers that only use what passed (and the exclusion counts).
+        """
         self.profile = profile
+        self.fast_reject = fast_reject
+        # Normalized once here rather than per opportunity; the profile is read at construction
+        terms = ProfileTerms.from_profile(profile)
         self._hard_rules: list[RuleFn] = [
-            apply_region_rule,
-            apply_keywords_rule,
+            functools.partial(apply_region_rule, terms=terms),
+            functools.partial(apply_keywords_rule, terms=terms),
             apply_deadline_rule,
             apply_budget_rule,
         ]
 
+    def closing_window(self, now: Optional[datetime] = None) -> Optional[tuple[datetime, datetime]]:
+        """
+        (earliest, latest) closing_at that can pass the deadline rule, for a store to
+        prefilter on (see OpportunityStore.iter_opportunities); None when the engine
+        has no deadline rule or the profile sets no max_days_to_close. Widened by a
+        minute each side so the rule, run later with its own clock, makes the exact call.
+        """
+        if apply_deadline_rule not in self._hard_rules or self.profile.max_days_to_close is None:
+            return None
+        now = now or datetime.now(timezone.utc)
+        slack = timedelta(minutes=1)
+        # The rule excludes closings in the past or whole days_out > max_days_to_close
+        return now - slack, now + timedelta(days=self.profile.max_days_to_close + 1) + slack
+
     def filter(self, opp: NormalizedOpportunity) -> FilterResult:
         """Apply all rules and return FilterResult with explanation trail."""
         explanations: list[str] = []
@@ -62,9 +99,14 @@ class FilterEngine:
                 all_passed = False
                 if excluded_by is None:
                     excluded_by = rule_id
+                if self.fast_reject:
+                    break
 
-        eligibility, elig_explanation = apply_eligibility_rule(opp, self.profile)
-        explanations.append(elig_explanation)
+        if all_passed or not self.fast_reject:
+            eligibility, elig_explanation = apply_eligibility_rule(opp, self.profile)
+            explanations.append(elig_explanation)
+        else:
+            eligibility = "unknown"
 
         return FilterResult(
             passed=all_passed,
@@ -81,10 +123,78 @@ class FilterEngine:
         """Filter multiple opportunities; returns all with full results."""
         return [self.filter(opp) for opp in opportunities]
 
+    def filter_many_parallel(
+        self,
+        opportunities: list[NormalizedOpportunity],
+        *,
+        workers: Optional[int] = None,
+        chunk_size: int = _PARALLEL_CHUNK_SIZE,
+        min_items: int = _MIN_PARALLEL_ITEMS,
+    ) -> list[FilterResult]:
+        """
+        Like filter_many, but filters chunks on a process pool (rules are pure Python,
+        so threads would not help). Falls back to filter_many for fewer than min_items
+        opportunities or a single CPU. The engine is sent to workers, so custom rules
+        must be picklable (module-level functions).
+        """
+        workers = workers or min(os.cpu_count() or 1, _MAX_WORKERS)
+        if workers <= 1 or len(opportunities) < min_items:
+            return self.filter_many(opportunities)
+        chunks = [
+            opportunities[start : start + chunk_size]
+            for start in range(0, len(opportunities), chunk_size)
+        ]
+        results: list[FilterResult] = []
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)),
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as pool:
+            # Workers return only the verdicts; opportunities are not pickled back
+            for chunk, verdicts in zip(chunks, pool.map(_filter_chunk, chunks)):
+                for opp, (passed, explanations, eligibility, excluded_by) in zip(chunk, verdicts):
+                    results.append(
+                        FilterResult(
+                            passed=passed,
+                            explanations=explanations,
+                            eligibility=eligibility,
+                            opportunity=opp,
+                            excluded_by_rule=excluded_by,
+                        )
+                    )
+        return results
+
+    def filter_iter(
+        self,
+        opportunities: Iterable[NormalizedOpportunity],
+    ) -> Iterator[FilterResult]:
+        """Filter lazily, one opportunity at a time (e.g. straight from a store cursor)."""
+        for opp in opportunities:
+            yield self.filter(opp)
+
     def filter_passed(
         self,
         opportunities: list[NormalizedOpportunity],
     ) -> list[FilterResult]:
-        """Filter and return only results that passed hard filters."""
-        results = self.filter_many(opportunities)
+        """
+        Filter and return only results that passed hard filters (on a process pool for
+        large inputs, see filter_many_parallel).
+        """
+        results = self.filter_many_parallel(opportunities)
         return [r for r in results if r.passed]
+
+
+def _init_worker(engine: FilterEngine) -> None:
+    global _worker_engine
+    _worker_engine = engine
+
+
+def _filter_chunk(
+    chunk: list[NormalizedOpportunity],
+) -> list[tuple[bool, list[str], str, Optional[str]]]:
+    """Pool task: filter a chunk with the worker's engine."""
+    verdicts = []
+    for opp in chunk:
+        r = _worker_engine.filter(opp)
+        verdicts.append((r.passed, r.explanations, r.eligibility, r.excluded_by_rule))
+    return verdicts
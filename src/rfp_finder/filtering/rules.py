@@ -1,9 +1,16 @@
 """Filter rules: each returns (passed, explanation)."""
 
+import functools
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Optional
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 from rfp_finder.matching import exclude_keyword_matches
 from rfp_finder.models.opportunity import NormalizedOpportunity
 from rfp_finder.models.profile import UserProfile
@@ -55,6 +62,34 @@ def _region_to_code(region: str) -> str:
     return r.upper()[:2] if len(r) >= 2 else r.upper()
 
 
+@functools.lru_cache(maxsize=32)
+def _keyword_scanner(keywords: tuple[str, ...]):
+    """
+    Hyperscan literal database matching any of keywords (already lowercased) in one pass,
+    regardless of how many there are; None when hyperscan is not installed or cannot
+    compile them. Built once per keyword set and process (databases do not pickle).
+    Not safe to scan from several threads at once (the database has one scratch space).
+    """
+    if hyperscan is None or not keywords or "" in keywords:
+        return None
+    db = hyperscan.Database()
+    try:
+        db.compile(
+            expressions=[kw.encode() for kw in keywords],
+            ids=list(range(len(keywords))),
+            elements=len(keywords),
+            flags=hyperscan.HS_FLAG_SINGLEMATCH,
+            literal=True,
+        )
+    except hyperscan.error:
+        return None
+    return db
+
+
+def _collect_match(keyword_id: int, start: int, end: int, flags: int, hits: list[int]) -> None:
+    hits.append(keyword_id)
+
+
 RULE_REGION = "region"
 RULE_KEYWORDS = "keywords"
 RULE_DEADLINE = "deadline"
@@ -62,10 +97,41 @@ RULE_BUDGET = "budget"
 RULE_ELIGIBILITY = "eligibility"
 
 
-def apply_region_rule(opp: NormalizedOpportunity, profile: UserProfile) -> tuple[bool, str, str]:
+@dataclass(frozen=True)
+class ProfileTerms:
+    """
+    Profile values the region and keywords rules match against, normalized once.
+    FilterEngine builds one per engine and binds it to those rules, so they do not
+    re-normalize the profile for every opportunity.
+    """
+
+    keywords: tuple[tuple[str, str], ...]  # (original, lowercased), in profile order
+    exclude_keywords: tuple[str, ...]
+    keywords_mode: str
+    eligible_regions: frozenset[str]
+    exclude_regions: frozenset[str]
+
+    @classmethod
+    def from_profile(cls, profile: UserProfile) -> "ProfileTerms":
+        return cls(
+            keywords=tuple((kw, kw.lower()) for kw in profile.keywords),
+            exclude_keywords=tuple(profile.exclude_keywords),
+            keywords_mode=getattr(profile, "keywords_mode", "required") or "required",
+            eligible_regions=frozenset(r.upper().strip() for r in profile.eligible_regions),
+            exclude_regions=frozenset(r.upper().strip() for r in profile.exclude_regions),
+        )
+
+
+def apply_region_rule(
+    opp: NormalizedOpportunity,
+    profile: UserProfile,
+    *,
+    terms: Optional[ProfileTerms] = None,
+) -> tuple[bool, str, str]:
     """
     Region filter: opp.region in profile.eligible_regions or "National".
     Maps CanadaBuys region strings (e.g. "*Ontario (except NCR)") to province codes.
+    terms: the profile's precomputed ProfileTerms (built from profile when omitted).
     """
     if not profile.eligible_regions and not profile.exclude_regions:
         return True, "Region filter not set", RULE_REGION
@@ -75,8 +141,9 @@ def apply_region_rule(opp: NormalizedOpportunity, profile: UserProfile) -> tuple
         return True, "Region not applicable (no region on opportunity)", RULE_REGION
 
     opp_code = _region_to_code(opp_region)
-    eligible_norm = [r.upper().strip() for r in profile.eligible_regions]
-    exclude_norm = [r.upper().strip() for r in profile.exclude_regions]
+    terms = terms or ProfileTerms.from_profile(profile)
+    eligible_norm = terms.eligible_regions
+    exclude_norm = terms.exclude_regions
 
     if opp_code.upper() in exclude_norm:
         return False, f"Excluded: region {opp_region} in exclude_regions", RULE_REGION
@@ -90,15 +157,23 @@ def apply_region_rule(opp: NormalizedOpportunity, profile: UserProfile) -> tuple
     return False, f"Excluded: region {opp_region} not in eligible_regions", RULE_REGION
 
 
-def apply_keywords_rule(opp: NormalizedOpportunity, profile: UserProfile) -> tuple[bool, str, str]:
+def apply_keywords_rule(
+    opp: NormalizedOpportunity,
+    profile: UserProfile,
+    *,
+    terms: Optional[ProfileTerms] = None,
+) -> tuple[bool, str, str]:
     """
     Keywords: exclude_keywords always apply (deal-breakers).
     When keywords_mode=required: must match at least one keyword.
     When keywords_mode=preferred or exclude_only: no keyword requirement (pass more to AI).
+    terms: the profile's precomputed ProfileTerms (built from profile when omitted).
     """
     if not profile.keywords and not profile.exclude_keywords:
         return True, "Keywords filter not set", RULE_KEYWORDS
 
+    terms = terms or ProfileTerms.from_profile(profile)
+
     searchable = " ".join(
         [
             opp.title,
@@ -108,20 +183,27 @@ def apply_keywords_rule(opp: NormalizedOpportunity, profile: UserProfile) -> tup
         ]
     ).lower()
 
-    for exc in profile.exclude_keywords:
+    for exc in terms.exclude_keywords:
         if exclude_keyword_matches(searchable, exc):
             return False, f"Excluded: deal-breaker keyword '{exc}' found", RULE_KEYWORDS
 
-    mode = getattr(profile, "keywords_mode", "required") or "required"
-    if mode in ("preferred", "exclude_only"):
+    if terms.keywords_mode in ("preferred", "exclude_only"):
         return True, "Keywords optional (mode: pass to AI)", RULE_KEYWORDS
 
-    if not profile.keywords:
+    if not terms.keywords:
         return True, "No required keywords", RULE_KEYWORDS
 
-    for kw in profile.keywords:
-        if kw.lower() in searchable:
-            return True, f"Matches keyword: {kw}", RULE_KEYWORDS
+    scanner = _keyword_scanner(tuple(kw_lower for _, kw_lower in terms.keywords))
+    if scanner is not None:
+        hits: list[int] = []
+        scanner.scan(searchable.encode(), match_event_handler=_collect_match, context=hits)
+        if hits:
+            # Report the first matching keyword in profile order, like the loop below
+            return True, f"Matches keyword: {terms.keywords[min(hits)][0]}", RULE_KEYWORDS
+    else:
+        for kw, kw_lower in terms.keywords:
+            if kw_lower in searchable:
+                return True, f"Matches keyword: {kw}", RULE_KEYWORDS
 
     return False, f"No required keywords found (need one of: {profile.keywords})", RULE_KEYWORDS
 
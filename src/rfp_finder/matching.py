@@ -1,8 +1,15 @@
 """Shared keyword matching utilities for filtering and scoring."""
 
+import functools
 import re
 
 
+@functools.lru_cache(maxsize=1024)
+def _word_pattern(word: str) -> re.Pattern[str]:
+    """Compiled word-boundary pattern for an already-lowercased word or phrase."""
+    return re.compile(rf"\b{re.escape(word)}\b")
+
+
 def exclude_keyword_matches(text: str, keyword: str) -> bool:
     """
     Check if exclude keyword appears as a standalone word.
@@ -13,9 +20,7 @@ def exclude_keyword_matches(text: str, keyword: str) -> bool:
     if not keyword or not text:
         return False
     text_lower = text.lower()
-    kw = re.escape(keyword.lower().strip())
-    pattern = rf"\b{kw}\b"
-    for m in re.finditer(pattern, text_lower):
+    for m in _word_pattern(keyword.lower().strip()).finditer(text_lower):
         start = m.start()
         # Reject hyphenated compound: "non-printing" when searching "printing"
         if start > 0 and text_lower[start - 1] == "-":
@@ -28,8 +33,7 @@ def _word_in_text(text: str, word: str) -> bool:
     """Word-boundary match for single word (avoids substring false positives)."""
     if not word or not text:
         return False
-    pattern = rf"\b{re.escape(word.lower())}\b"
-    return bool(re.search(pattern, text.lower()))
+    return _word_pattern(word.lower()).search(text.lower()) is not None
 
 
 def positive_keyword_matches(text: str, keyword: str) -> bool:
@@ -1,5 +1,6 @@
 """User profile model for filtering and preferences."""
 
+import functools
 from decimal import Decimal
 from pathlib import Path
 from typing import Optional
@@ -12,6 +13,9 @@ except ModuleNotFoundError as e:
     ) from e
 from pydantic import BaseModel, Field
 
+# libyaml's C loader when PyYAML was built with it (several times faster), same safe subset
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class UserProfile(BaseModel):
     """User profile with filters and eligibility constraints."""
@@ -47,8 +51,20 @@ class UserProfile(BaseModel):
 
     @classmethod
     def from_yaml(cls, path: str | Path) -> "UserProfile":
-        """Load profile from YAML file. Supports nested (filters/eligibility) or flat structure."""
-        data = yaml.safe_load(Path(path).read_text()) or {}
+        """
+        Load profile from YAML file. Supports nested (filters/eligibility) or flat structure.
+        Parses are cached per (path, mtime, size), so an unchanged file is parsed once per
+        process; each call returns its own copy.
+        """
+        if cls is not UserProfile:
+            return cls._parse_yaml(path)
+        resolved = Path(path).resolve()
+        st = resolved.stat()
+        return _load_profile(str(resolved), st.st_mtime_ns, st.st_size).model_copy(deep=True)
+
+    @classmethod
+    def _parse_yaml(cls, path: str | Path) -> "UserProfile":
+        data = yaml.load(Path(path).read_bytes(), Loader=_YamlLoader) or {}
         flat: dict = {"profile_id": data.get("profile_id", "default")}
         filters = data.get("filters", {})
         elig = data.get("eligibility", {})
@@ -72,3 +88,9 @@ class UserProfile(BaseModel):
         flat["security_clearance"] = _get("security_clearance", elig, data)
         flat["local_vendor_only"] = _get("local_vendor_only", elig, data)
         return cls.model_validate(flat)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_profile(path: str, mtime_ns: int, size: int) -> UserProfile:
+    """Parse a profile; mtime_ns and size are only cache-key parts, so edits miss the cache."""
+    return UserProfile._parse_yaml(path)
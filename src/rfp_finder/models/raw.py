@@ -14,3 +14,11 @@ class RawOpportunity(BaseModel):
     model_config = ConfigDict(extra="allow")
 
     data: dict[str, Any] = Field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RawOpportunity":
+        """
+        Wrap a connector-built dict without validating or copying it (the record takes
+        ownership). For hot per-row paths; data must already be a str-keyed dict.
+        """
+        return cls.model_construct(data=data)
@@ -26,13 +26,17 @@ def run_pipeline(
     When return_filter_results=True, returns (scored, filter_results).
     """
     store = OpportunityStore(db_path)
-    opportunities = store.get_by_status(status) if status else store.get_all()
+    # Callers without filter results only see what passed
+    engine = FilterEngine(profile, fast_reject=not return_filter_results)
+    # Filter results for stats cover every opportunity; otherwise skip, in SQL, those
+    # closing outside the deadline window
+    window = None if return_filter_results else engine.closing_window()
+    opportunities = list(store.iter_opportunities(status or None, closing_window=window))
 
     if not opportunities:
         return ([], []) if return_filter_results else []
 
-    engine = FilterEngine(profile)
-    results = engine.filter_many(opportunities)
+    results = engine.filter_many_parallel(opportunities)
     passed = [r.opportunity for r in results if r.passed]
 
     if not passed:
@@ -72,6 +76,6 @@ def run_filter_only(
         return [], []
 
     engine = FilterEngine(profile)
-    results = engine.filter_many(opportunities)
+    results = engine.filter_many_parallel(opportunities)
     passed = [r.opportunity for r in results if r.passed]
     return passed, results
@@ -62,15 +62,19 @@ def score_opportunities(
         and cache_dir is not None
         and attachment_cache_store is not None
     )
-    enriched_indices = set(enrich_order) if can_enrich else set()
-    for i, opp in enumerate(shortlist):
-        enriched_text: str | None = None
-        if can_enrich and i in enriched_indices:
-            from rfp_finder.attachments import enrich_opportunity
+    enriched_texts: dict[int, str] = {}
+    if can_enrich and enrich_order:
+        from rfp_finder.attachments import enrich_opportunities
 
-            enriched_text = enrich_opportunity(
-                opp, cache_dir, attachment_cache_store, fetch_missing=True
-            )
+        texts = enrich_opportunities(
+            [shortlist[i] for i in enrich_order],
+            cache_dir,
+            attachment_cache_store,
+            fetch_missing=True,
+        )
+        enriched_texts = dict(zip(enrich_order, texts))
+    for i, opp in enumerate(shortlist):
+        enriched_text = enriched_texts.get(i)
 
         sim = paired[i][1] if i < len(paired) else None
         llm_result = score_with_llm(
@@ -66,13 +66,15 @@ _NON_TECH_TITLE_PHRASES = (
 )
 
 
-def _keyword_in_lead(title: str, content: str, keyword: str) -> bool:
-    """True if keyword appears in title or first 300 chars of content."""
-    title_lower = (title or "").lower()
-    content_lower = (content or "").lower()
-    lead = content_lower[:_KEYWORD_LEAD_CHARS]
+def _lowered_title_lead(title: str, content: str) -> tuple[str, str]:
+    """Lowercased title and first 300 chars of content (only the lead is lowercased)."""
+    return (title or "").lower(), (content or "")[:_KEYWORD_LEAD_CHARS].lower()
+
+
+def _keyword_in_lead(title_lower: str, lead_lower: str, keyword: str) -> bool:
+    """True if keyword appears in title or lead, as returned by _lowered_title_lead."""
     return positive_keyword_matches(title_lower, keyword) or positive_keyword_matches(
-        lead, keyword
+        lead_lower, keyword
     )
 
 
@@ -121,17 +123,20 @@ def _score_stub(
 
     # +4 if category == SRV (Services) — but not for non-tech services (transportation, etc.)
     cats = [c.upper() for c in (opp.categories or [])]
-    if _CAT_SRV in cats and not _is_non_tech_title_lead(opp.title or "", content):
+    non_tech_lead = _is_non_tech_title_lead(opp.title or "", content)
+    if _CAT_SRV in cats and not non_tech_lead:
         score += 4
         reasons.append("Category: Services (SRV)")
 
     # +5 per keyword in first 300 chars (title + lead), max 3 matches
     kw_matches = 0
     if profile.keywords:
+        # Lowercased once here rather than per keyword (content may be a whole enriched document)
+        title_lower, lead_lower = _lowered_title_lead(opp.title or "", content)
         for kw in profile.keywords[:30]:
             if kw_matches >= 3:
                 break
-            if _keyword_in_lead(opp.title or "", content, kw):
+            if _keyword_in_lead(title_lower, lead_lower, kw):
                 score += 5
                 reasons.append(f"Keyword in scope: {kw}")
                 kw_matches += 1
@@ -147,7 +152,7 @@ def _score_stub(
         risks.append("Category/commodity: non-tech")
 
     # -10 if title/lead indicates non-tech (furniture, hardware procurement, transportation)
-    if _is_non_tech_title_lead(opp.title or "", content):
+    if non_tech_lead:
         score -= 10
         risks.append("Title/scope: non-tech procurement")
 
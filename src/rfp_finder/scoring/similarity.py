@@ -4,9 +4,12 @@ import re
 from collections import Counter
 
 
+_TOKEN_RE = re.compile(r"\b[a-z0-9]{2,}\b")
+
+
 def _tokenize(text: str) -> list[str]:
     """Lowercase, extract word tokens (alphanumeric)."""
-    return re.findall(r"\b[a-z0-9]{2,}\b", (text or "").lower())
+    return _TOKEN_RE.findall((text or "").lower())
 
 
 def _tf(text: str) -> Counter:
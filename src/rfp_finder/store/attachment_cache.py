@@ -2,10 +2,18 @@
 
 import hashlib
 import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
+from rfp_finder.store.schema import CONNECTION_PRAGMAS, ensure_schema
+
+# Stay under SQLite's default bound-parameter limit (999 on older builds)
+_MAX_SQL_PARAMS = 900
+
 
 @dataclass
 class CachedAttachment:
@@ -19,6 +27,7 @@ class CachedAttachment:
     text_length: int | None
     page_count: int | None
     error_message: str | None
+    content_hash: str | None = None  # SHA-256 of downloaded bytes
 
 
 class AttachmentCacheStore:
@@ -26,17 +35,55 @@ class AttachmentCacheStore:
 
     def __init__(self, db_path: str | Path = "rfp_finder.db"):
         self._db_path = Path(db_path)
+        self._local = threading.local()  # per-thread connection of an open transaction()
         self._ensure_schema()
 
-    def _connection(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path)
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._db_path, timeout=30.0)
         conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         return conn
 
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Connection for one operation: commits on success and closes. Inside
+        transaction(), yields the transaction's connection and leaves committing to it.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            yield conn
+            return
+        conn = self._connect()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Group this thread's reads and writes into one transaction (one commit) on a
+        shared connection, e.g. all attachment upserts of one opportunity. Nested calls
+        join the outer transaction. Rolls back if the block raises.
+        """
+        if getattr(self._local, "conn", None) is not None:
+            yield
+            return
+        conn = self._connect()
+        self._local.conn = conn
+        try:
+            with conn:
+                yield
+        finally:
+            self._local.conn = None
+            conn.close()
+
     def _ensure_schema(self) -> None:
-        schema_path = Path(__file__).parent / "schema.sql"
         with self._connection() as conn:
-            conn.executescript(schema_path.read_text())
+            ensure_schema(conn)
 
     @staticmethod
     def _url_to_filename(url: str) -> str:
@@ -54,6 +101,41 @@ class AttachmentCacheStore:
             ).fetchone()
         if not row:
             return None
+        return self._row_to_cached(row)
+
+    def get_cached_many(self, urls: list[str]) -> dict[str, CachedAttachment]:
+        """Get cached attachments for several URLs in one query. Missing URLs are omitted."""
+        unique = list(dict.fromkeys(urls))
+        found: dict[str, CachedAttachment] = {}
+        with self._connection() as conn:
+            for i in range(0, len(unique), _MAX_SQL_PARAMS):
+                batch = unique[i : i + _MAX_SQL_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    f"SELECT * FROM attachment_cache WHERE url IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                for row in rows:
+                    found[row["url"]] = self._row_to_cached(row)
+        return found
+
+    def get_by_content_hash(self, content_hash: str) -> CachedAttachment | None:
+        """
+        Get a successfully extracted attachment with identical file contents, if any.
+        Lets re-hosted or session-URL copies of the same document skip re-extraction.
+        """
+        with self._connection() as conn:
+            row = conn.execute(
+                """
+                SELECT * FROM attachment_cache
+                WHERE content_hash = ? AND extraction_status = 'success'
+                ORDER BY fetched_at DESC LIMIT 1
+                """,
+                (content_hash,),
+            ).fetchone()
+        return self._row_to_cached(row) if row else None
+
+    def _row_to_cached(self, row: sqlite3.Row) -> CachedAttachment:
         return CachedAttachment(
             url=row["url"],
             local_path=row["local_path"],
@@ -63,6 +145,7 @@ class AttachmentCacheStore:
             text_length=row["text_length"],
             page_count=row["page_count"],
             error_message=row["error_message"],
+            content_hash=row["content_hash"],
         )
 
     def upsert(
@@ -75,6 +158,7 @@ class AttachmentCacheStore:
         text_length: int | None = None,
         page_count: int | None = None,
         error_message: str | None = None,
+        content_hash: str | None = None,
     ) -> None:
         """Insert or update cache entry."""
         now = datetime.now(timezone.utc).isoformat()
@@ -82,9 +166,10 @@ class AttachmentCacheStore:
             conn.execute(
                 """
                 INSERT INTO attachment_cache
-                (url, local_path, fetched_at, extraction_status, extracted_text, text_length, page_count, error_message)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                (url, content_hash, local_path, fetched_at, extraction_status, extracted_text, text_length, page_count, error_message)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ON CONFLICT(url) DO UPDATE SET
+                    content_hash = excluded.content_hash,
                     local_path = excluded.local_path,
                     fetched_at = excluded.fetched_at,
                     extraction_status = excluded.extraction_status,
@@ -95,6 +180,7 @@ class AttachmentCacheStore:
                 """,
                 (
                     url,
+                    content_hash,
                     local_path,
                     now,
                     extraction_status,
@@ -104,7 +190,6 @@ class AttachmentCacheStore:
                     error_message or "",
                 ),
             )
-            conn.commit()
 
     def update_extraction(
         self,
@@ -130,4 +215,3 @@ class AttachmentCacheStore:
                 """,
                 (status, extracted_text, text_length, page_count, error_message, url),
             )
-            conn.commit()
@@ -1,10 +1,16 @@
 """Store for good/bad fit examples used in AI relevance scoring."""
 
 import sqlite3
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
+from rfp_finder.store.schema import ensure_schema
+
+# Stay under SQLite's default bound-parameter limit (999 on older builds)
+_MAX_SQL_PARAMS = 900
+
 
 @dataclass
 class Example:
@@ -33,9 +39,8 @@ class ExampleStore:
         return conn
 
     def _ensure_schema(self) -> None:
-        schema_path = Path(__file__).parent / "schema.sql"
         with self._connection() as conn:
-            conn.executescript(schema_path.read_text())
+            ensure_schema(conn)
 
     def add(
         self,
@@ -72,6 +77,46 @@ class ExampleStore:
             created_at=datetime.now(timezone.utc),
         )
 
+    def add_many(self, profile_id: str, rows: Iterable[tuple[str, str]]) -> int:
+        """
+        Add (url, label) examples in one transaction with executemany. Labels must be
+        'good' or 'bad'. Returns number of rows added.
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        params = []
+        for url, label in rows:
+            if label not in ("good", "bad"):
+                raise ValueError("label must be 'good' or 'bad'")
+            params.append((profile_id, url, label, "", "", "", now))
+        with self._connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO examples (profile_id, url, label, title, summary, raw_text, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                params,
+            )
+            conn.commit()
+        return len(params)
+
+    def filter_new_urls(self, profile_id: str, urls: list[str]) -> list[str]:
+        """
+        Return urls (deduplicated, in order) not yet stored for profile_id. Checks only
+        the candidates with indexed IN queries instead of loading every example.
+        """
+        candidates = list(dict.fromkeys(urls))
+        existing: set[str] = set()
+        with self._connection() as conn:
+            for i in range(0, len(candidates), _MAX_SQL_PARAMS):
+                batch = candidates[i : i + _MAX_SQL_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    f"SELECT url FROM examples WHERE profile_id = ? AND url IN ({placeholders})",
+                    (profile_id, *batch),
+                )
+                existing.update(row["url"] for row in rows)
+        return [url for url in candidates if url not in existing]
+
     def list_by_profile(self, profile_id: str) -> list[Example]:
         """List all examples for a profile."""
         with self._connection() as conn:
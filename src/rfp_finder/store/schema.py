@@ -0,0 +1,35 @@
+"""Schema setup shared by the opportunity, example and attachment cache stores."""
+
+import functools
+import sqlite3
+import zlib
+from pathlib import Path
+
+# Per-connection settings for the stores: WAL makes NORMAL sync safe (no fsync per
+# commit), temp tables in memory, and reads through a 256 MiB memory map
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+@functools.cache
+def _schema() -> tuple[str, int]:
+    """(schema.sql text, version stamp); the stamp changes whenever the file does."""
+    sql = (Path(__file__).parent / "schema.sql").read_text()
+    return sql, zlib.crc32(sql.encode()) & 0x7FFFFFFF or 1
+
+
+def ensure_schema(conn: sqlite3.Connection) -> None:
+    """
+    Create tables and indexes, and switch the file to WAL (persistent per database file:
+    readers no longer block the writer). The database's user_version records the schema
+    applied, so a file already up to date costs one PRAGMA read instead of the script.
+    """
+    sql, version = _schema()
+    if conn.execute("PRAGMA user_version").fetchone()[0] == version:
+        return
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(sql)
+    conn.execute(f"PRAGMA user_version = {version}")
@@ -31,6 +31,13 @@ CREATE TABLE IF NOT EXISTS runs (
 CREATE INDEX IF NOT EXISTS idx_runs_source ON runs(source);
 CREATE INDEX IF NOT EXISTS idx_runs_started ON runs(started_at);
 
+-- Passed opportunity ids from the last filter run per (profile, status, store state, day)
+CREATE TABLE IF NOT EXISTS filter_cache (
+    cache_key TEXT PRIMARY KEY,
+    opportunity_ids TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+
 -- Phase 4: Example opportunities for AI relevance scoring
 CREATE TABLE IF NOT EXISTS examples (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -44,6 +51,7 @@ CREATE TABLE IF NOT EXISTS examples (
 );
 CREATE INDEX IF NOT EXISTS idx_examples_profile ON examples(profile_id);
 CREATE INDEX IF NOT EXISTS idx_examples_label ON examples(label);
+CREATE INDEX IF NOT EXISTS idx_examples_profile_url ON examples(profile_id, url);
 
 -- Phase 5: Attachment cache and extraction
 CREATE TABLE IF NOT EXISTS attachment_cache (
@@ -57,3 +65,4 @@ CREATE TABLE IF NOT EXISTS attachment_cache (
     page_count INTEGER,
     error_message TEXT
 );
+CREATE INDEX IF NOT EXISTS idx_attachment_cache_content_hash ON attachment_cache(content_hash);
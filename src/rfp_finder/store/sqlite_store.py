@@ -1,12 +1,27 @@
 """SQLite-backed opportunity store with deduplication and change tracking."""
 
+import hashlib
+import itertools
 import json
 import sqlite3
-from datetime import datetime, timezone
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
+from rfp_finder import __version__
 from rfp_finder.models.opportunity import NormalizedOpportunity
+from rfp_finder.store.schema import CONNECTION_PRAGMAS, ensure_schema
+
+if TYPE_CHECKING:
+    from rfp_finder.models.profile import UserProfile  # imports PyYAML
+
+
+def _batched(items: Iterable, size: int) -> Iterator[tuple]:
+    """Yield tuples of up to size items (itertools.batched needs Python 3.12)."""
+    it = iter(items)
+    while batch := tuple(itertools.islice(it, size)):
+        yield batch
 
 
 class RunRecord:
@@ -46,12 +61,13 @@ class OpportunityStore:
     def _connection(self) -> sqlite3.Connection:
         conn = sqlite3.connect(self._db_path)
         conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         return conn
 
     def _ensure_schema(self) -> None:
-        schema_path = Path(__file__).parent / "schema.sql"
         with self._connection() as conn:
-            conn.executescript(schema_path.read_text())
+            ensure_schema(conn)
 
     def _resolve_status(self, opp: NormalizedOpportunity) -> str:
         """Resolve final status including closed (past closing date)."""
@@ -66,65 +82,95 @@ class OpportunityStore:
         return opp.status if opp.status in ("open", "amended", "unknown") else "open"
 
     def _serialize_opp(self, opp: NormalizedOpportunity) -> str:
-        """Serialize opportunity to JSON for storage."""
-        data = opp.model_dump(mode="json")
-        return json.dumps(data, default=str)
+        """Serialize opportunity to JSON for storage (in pydantic-core, no intermediate dict)."""
+        return opp.model_dump_json()
 
     def _deserialize_opp(self, row: sqlite3.Row) -> NormalizedOpportunity:
         """Deserialize stored row to NormalizedOpportunity."""
-        data = json.loads(row["data"])
-        return NormalizedOpportunity.model_validate(data)
+        return NormalizedOpportunity.model_validate_json(row["data"])
 
     def upsert(self, opp: NormalizedOpportunity) -> tuple[bool, bool]:
         """
         Insert or update opportunity. Returns (was_new, was_amended).
         """
-        now = datetime.now(timezone.utc).isoformat()
-        status = self._resolve_status(opp)
-        opp_copy = opp.model_copy(update={"status": status})
-        data_str = self._serialize_opp(opp_copy)
-        content_hash = opp.content_hash or ""
-        was_new = False
-        was_amended = False
+        items_new, items_amended = self.upsert_many([opp])
+        return (items_new == 1, items_amended == 1)
 
+    def upsert_many(
+        self, opps: Iterable[NormalizedOpportunity], batch_size: int = 500
+    ) -> tuple[int, int]:
+        """
+        Insert or update many opportunities in one transaction (one commit), with the
+        same rules as upsert. Existing rows are looked up batch_size at a time (kept
+        under SQLite's bound-parameter limit). Returns (items_new, items_amended).
+        """
+        items_new = 0
+        items_amended = 0
+        now = datetime.now(timezone.utc).isoformat()
         with self._connection() as conn:
-            cursor = conn.execute(
-                "SELECT id, content_hash FROM opportunities WHERE source = ? AND source_id = ?",
-                (opp.source, opp.source_id),
-            )
-            existing = cursor.fetchone()
-
-            if existing:
-                prior_hash = existing["content_hash"]
-                if prior_hash != content_hash:
-                    was_amended = True
-                    conn.execute(
-                        """
-                        UPDATE opportunities SET
-                            content_hash = ?, status = ?, prior_content_hash = ?,
-                            data = ?, last_seen_at = ?
-                        WHERE id = ?
-                        """,
-                        (content_hash, status, prior_hash, data_str, now, opp.id),
-                    )
-                else:
-                    # Same source content: still update data so normalization improvements persist
-                    conn.execute(
-                        "UPDATE opportunities SET data = ?, last_seen_at = ? WHERE id = ?",
-                        (data_str, now, opp.id),
-                    )
-            else:
-                was_new = True
-                conn.execute(
+            conn.execute("BEGIN IMMEDIATE")
+            for batch in _batched(opps, batch_size):
+                existing = self._existing_hashes(conn, batch)
+                inserts: list[tuple] = []
+                amends: list[tuple] = []
+                touches: list[tuple] = []
+                for opp in batch:
+                    status = self._resolve_status(opp)
+                    data_str = self._serialize_opp(opp.model_copy(update={"status": status}))
+                    content_hash = opp.content_hash or ""
+                    key = (opp.source, opp.source_id)
+                    if key not in existing:
+                        items_new += 1
+                        inserts.append(
+                            (opp.id, opp.source, opp.source_id, content_hash, status, data_str, now, now)
+                        )
+                    elif existing[key] != content_hash:
+                        items_amended += 1
+                        amends.append((content_hash, status, existing[key], data_str, now, opp.id))
+                    else:
+                        # Same source content: still update data so normalization improvements persist
+                        touches.append((data_str, now, opp.id))
+                    existing[key] = content_hash  # repeated ids later in the batch are updates
+                conn.executemany(
                     """
                     INSERT INTO opportunities (id, source, source_id, content_hash, status, data, first_seen_at, last_seen_at)
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                     """,
-                    (opp.id, opp.source, opp.source_id, content_hash, status, data_str, now, now),
+                    inserts,
                 )
-            conn.commit()
+                conn.executemany(
+                    """
+                    UPDATE opportunities SET
+                        content_hash = ?, status = ?, prior_content_hash = ?,
+                        data = ?, last_seen_at = ?
+                    WHERE id = ?
+                    """,
+                    amends,
+                )
+                conn.executemany(
+                    "UPDATE opportunities SET data = ?, last_seen_at = ? WHERE id = ?",
+                    touches,
+                )
+        return (items_new, items_amended)
 
-        return (was_new, was_amended)
+    def _existing_hashes(
+        self, conn: sqlite3.Connection, opps: Iterable[NormalizedOpportunity]
+    ) -> dict[tuple[str, str], str]:
+        """Map (source, source_id) -> stored content_hash for the given opportunities."""
+        ids_by_source: dict[str, set[str]] = {}
+        for opp in opps:
+            ids_by_source.setdefault(opp.source, set()).add(opp.source_id)
+        found: dict[tuple[str, str], str] = {}
+        for source, source_ids in ids_by_source.items():
+            placeholders = ",".join("?" * len(source_ids))
+            rows = conn.execute(
+                f"SELECT source_id, content_hash FROM opportunities "
+                f"WHERE source = ? AND source_id IN ({placeholders})",
+                (source, *source_ids),
+            )
+            for row in rows:
+                found[(source, row["source_id"])] = row["content_hash"]
+        return found
 
     def get_all(self) -> list[NormalizedOpportunity]:
         """Return all opportunities."""
@@ -132,15 +178,158 @@ class OpportunityStore:
             rows = conn.execute("SELECT * FROM opportunities ORDER BY last_seen_at DESC").fetchall()
         return [self._deserialize_opp(r) for r in rows]
 
-    def get_by_status(self, status: str) -> list[NormalizedOpportunity]:
-        """Return opportunities with given status."""
+    def get_by_status(
+        self, status: str, limit: int | None = None, offset: int = 0
+    ) -> list[NormalizedOpportunity]:
+        """
+        Return opportunities with given status, most recently seen first. limit/offset
+        page through them in SQL, so skipped rows are never loaded.
+        """
+        sql = "SELECT data FROM opportunities WHERE status = ? ORDER BY last_seen_at DESC"
+        params: tuple = (status,)
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params += (-1 if limit is None else limit, offset)
         with self._connection() as conn:
-            rows = conn.execute(
-                "SELECT * FROM opportunities WHERE status = ? ORDER BY last_seen_at DESC",
-                (status,),
-            ).fetchall()
+            rows = conn.execute(sql, params).fetchall()
         return [self._deserialize_opp(r) for r in rows]
 
+    def get_many(self, opp_ids: list[str]) -> list[NormalizedOpportunity]:
+        """Get opportunities by id, in the given order; unknown ids are skipped."""
+        found: dict[str, NormalizedOpportunity] = {}
+        with self._connection() as conn:
+            for batch in _batched(opp_ids, 500):
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    f"SELECT id, data FROM opportunities WHERE id IN ({placeholders})", batch
+                )
+                for row in rows:
+                    found[row["id"]] = self._deserialize_opp(row)
+        return [found[i] for i in opp_ids if i in found]
+
+    def fingerprint(self) -> str:
+        """
+        Cheap token that changes whenever opportunities are added or upserted
+        (every upsert bumps last_seen_at). Used to key derived caches.
+        """
+        with self._connection() as conn:
+            count, last_seen = conn.execute(
+                "SELECT COUNT(*), MAX(last_seen_at) FROM opportunities"
+            ).fetchone()
+        return f"{count}:{last_seen or ''}"
+
+    def filter_cache_key(self, profile: "UserProfile", status: Optional[str]) -> str:
+        """
+        Key for cached filter results: package version, profile, status, store contents, and
+        today's (UTC) date, so entries turn over daily. The deadline rule compares against
+        the current time, so readers must re-check it on cached ids.
+        """
+        parts = [
+            __version__,
+            profile.model_dump_json(),
+            status or "",
+            self.fingerprint(),
+            datetime.now(timezone.utc).date().isoformat(),
+        ]
+        return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+    def get_filter_cache(self, cache_key: str) -> list[str] | None:
+        """Passed opportunity ids stored under cache_key, or None."""
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT opportunity_ids FROM filter_cache WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+        return json.loads(row["opportunity_ids"]) if row else None
+
+    def put_filter_cache(self, cache_key: str, opp_ids: list[str]) -> None:
+        """Store passed opportunity ids under cache_key, dropping entries older than a week."""
+        now = datetime.now(timezone.utc)
+        with self._connection() as conn:
+            conn.execute(
+                "DELETE FROM filter_cache WHERE created_at < ?",
+                ((now - timedelta(days=7)).isoformat(),),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO filter_cache (cache_key, opportunity_ids, created_at) VALUES (?, ?, ?)",
+                (cache_key, json.dumps(opp_ids), now.isoformat()),
+            )
+
+    @staticmethod
+    def _where(
+        status: str | None, closing_window: tuple[datetime, datetime] | None
+    ) -> tuple[str, tuple]:
+        """
+        WHERE clause for count/iter_opportunities. closing_window keeps rows closing within
+        [earliest, latest] (compared in UTC by julianday) plus rows with no closing date.
+        """
+        clauses: list[str] = []
+        params: list = []
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if closing_window is not None:
+            clauses.append(
+                "(json_extract(data, '$.closing_at') IS NULL"
+                " OR julianday(json_extract(data, '$.closing_at')) BETWEEN julianday(?) AND julianday(?))"
+            )
+            params.extend(bound.isoformat() for bound in closing_window)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), tuple(params)
+
+    def count(
+        self,
+        status: str | None = None,
+        *,
+        closing_window: tuple[datetime, datetime] | None = None,
+    ) -> int:
+        """
+        Number of opportunities (with given status / closing window, as in
+        iter_opportunities), without loading rows.
+        """
+        where, params = self._where(status, closing_window)
+        with self._connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM opportunities" + where, params).fetchone()[0]
+
+    def iter_opportunities(
+        self,
+        status: str | None = None,
+        batch_size: int = 500,
+        *,
+        closing_window: tuple[datetime, datetime] | None = None,
+    ) -> Iterator[NormalizedOpportunity]:
+        """
+        Yield opportunities (all, or with given status) like get_all/get_by_status, but
+        read from the cursor batch_size rows at a time instead of loading every row.
+        closing_window=(earliest, latest) skips, in SQL, rows closing outside it (rows
+        without a closing date are kept); see FilterEngine.closing_window.
+        """
+        where, params = self._where(status, closing_window)
+        sql = "SELECT data FROM opportunities" + where
+        conn = self._connection()
+        try:
+            cursor = conn.execute(sql + " ORDER BY last_seen_at DESC", params)
+            while rows := cursor.fetchmany(batch_size):
+                for row in rows:
+                    yield self._deserialize_opp(row)
+        finally:
+            conn.close()
+
+    def iter_json(self, status: str | None = None, batch_size: int = 500) -> Iterator[str]:
+        """
+        Like iter_opportunities, but yield each row's stored JSON text without parsing it
+        (one compact JSON object per opportunity, as written by _serialize_opp).
+        """
+        where, params = self._where(status, None)
+        conn = self._connection()
+        try:
+            cursor = conn.execute(
+                "SELECT data FROM opportunities" + where + " ORDER BY last_seen_at DESC", params
+            )
+            while rows := cursor.fetchmany(batch_size):
+                for row in rows:
+                    yield row["data"]
+        finally:
+            conn.close()
+
     def get_modified_since(self, since: datetime) -> list[NormalizedOpportunity]:
         """Return opportunities modified (last_seen_at) since given datetime."""
         since_str = since.isoformat()
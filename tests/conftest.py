@@ -68,8 +68,8 @@ def sample_canadabuys_csv_content(sample_canadabuys_csv_row: dict[str, str]) ->
 
 @pytest.fixture
 def canadabuys_connector_patched(sample_canadabuys_csv_content: str):
-    """Context manager that patches CanadaBuysConnector._fetch_csv with sample data."""
+    """Context manager that patches CanadaBuysConnector._iter_csv_lines with sample data."""
     return patch(
-        "rfp_finder.connectors.canadabuys.connector.CanadaBuysConnector._fetch_csv",
-        return_value=sample_canadabuys_csv_content,
+        "rfp_finder.connectors.canadabuys.connector.CanadaBuysConnector._iter_csv_lines",
+        return_value=sample_canadabuys_csv_content.splitlines(keepends=True),
     )
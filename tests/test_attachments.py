@@ -1,12 +1,24 @@
 """Tests for Phase 5 attachment handling."""
 
+import asyncio
+import math
+import sqlite3
 import tempfile
 from pathlib import Path
 
+import httpx
 import pytest
 
+from rfp_finder.attachments import extractor
+from rfp_finder.attachments.enricher import enrich_opportunities, enrich_opportunity
 from rfp_finder.attachments.extractor import extract_text_from_pdf
-from rfp_finder.attachments.fetcher import _url_to_filename
+from rfp_finder.attachments.fetcher import (
+    DomainRateLimiter,
+    _url_to_filename,
+    fetch_attachment,
+    fetch_attachment_async,
+)
+from rfp_finder.models.opportunity import AttachmentRef, NormalizedOpportunity
 from rfp_finder.store.attachment_cache import AttachmentCacheStore
 
 
@@ -16,6 +28,151 @@ class TestFetcher:
         assert _url_to_filename("https://example.com/page").endswith(".bin")
         assert len(_url_to_filename("https://a.com/1.pdf")) == 20  # 16 hex + .pdf
 
+    def test_fetch_attachment_streams_to_file(self, tmp_path: Path) -> None:
+        body = b"%PDF-1.4 " + b"x" * 200_000
+        transport = httpx.MockTransport(lambda req: httpx.Response(200, content=body))
+        with httpx.Client(transport=transport) as client:
+            local_path, err = fetch_attachment(
+                "https://example.com/big.pdf", tmp_path, client=client
+            )
+        assert err is None
+        assert local_path is not None
+        assert local_path.read_bytes() == body
+
+    def test_fetch_attachment_discards_truncated_download(self, tmp_path: Path) -> None:
+        transport = httpx.MockTransport(
+            lambda req: httpx.Response(200, content=b"%PDF-", headers={"Content-Length": "100"})
+        )
+        with httpx.Client(transport=transport) as client:
+            local_path, err = fetch_attachment(
+                "https://example.com/cut.pdf", tmp_path, client=client
+            )
+        assert local_path is None
+        assert err is not None and "Incomplete download" in err
+        assert list(tmp_path.iterdir()) == []
+
+    def test_fetch_attachment_async_writes_file(self, tmp_path: Path) -> None:
+        transport = httpx.MockTransport(lambda req: httpx.Response(200, content=b"%PDF-1.4 data"))
+
+        async def _run() -> tuple[Path | None, str | None]:
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await fetch_attachment_async(
+                    "https://example.com/doc.pdf", tmp_path, client=client
+                )
+
+        local_path, err = asyncio.run(_run())
+        assert err is None
+        assert local_path is not None
+        assert local_path.read_bytes() == b"%PDF-1.4 data"
+
+    def test_fetch_attachment_async_reports_http_error(self, tmp_path: Path) -> None:
+        transport = httpx.MockTransport(lambda req: httpx.Response(404))
+
+        async def _run() -> tuple[Path | None, str | None]:
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await fetch_attachment_async(
+                    "https://example.com/missing.pdf", tmp_path, client=client
+                )
+
+        local_path, err = asyncio.run(_run())
+        assert local_path is None
+        assert err == "HTTP 404"
+
+    def test_fetch_attachment_async_discards_partial_downloads(self, tmp_path: Path) -> None:
+        class _BrokenStream(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                yield b"%PDF-1.4 partial"
+                raise httpx.ReadError("connection reset")
+
+        def _handler(req: httpx.Request) -> httpx.Response:
+            if req.url.path == "/cut.pdf":
+                return httpx.Response(200, content=b"%PDF-", headers={"Content-Length": "100"})
+            return httpx.Response(200, stream=_BrokenStream())
+
+        async def _run(url: str) -> tuple[Path | None, str | None]:
+            async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+                return await fetch_attachment_async(url, tmp_path, client=client)
+
+        local_path, err = asyncio.run(_run("https://example.com/cut.pdf"))
+        assert local_path is None
+        assert err is not None and "Incomplete download" in err
+        local_path, err = asyncio.run(_run("https://example.com/reset.pdf"))
+        assert local_path is None
+        assert err == "connection reset"
+        assert list(tmp_path.iterdir()) == []
+
+
+def _write_text_pdf(path: Path, page_texts: list[str]) -> None:
+    """Write a minimal PDF with one line of Helvetica text per page."""
+    n = len(page_texts)
+    font_id = 3 + 2 * n
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>"
+        % (b" ".join(b"%d 0 R" % (3 + 2 * i) for i in range(n)), n),
+    ]
+    for i, text in enumerate(page_texts):
+        stream = b"BT /F1 12 Tf 10 50 Td (%s) Tj ET" % text.encode()
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 200 100] "
+            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>" % (font_id, 4 + 2 * i)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (num, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % off for off in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(bytes(out))
+
+
+class TestDomainRateLimiter:
+    def test_spaces_same_domain_but_not_other_domains(self) -> None:
+        limiter = DomainRateLimiter(min_interval=0.2)
+
+        async def _run() -> tuple[float, float]:
+            loop = asyncio.get_running_loop()
+            await limiter.acquire("a.com")
+            start = loop.time()
+            await limiter.acquire("b.com")
+            other = loop.time() - start
+            await limiter.acquire("a.com")
+            same = loop.time() - start
+            return other, same
+
+        other, same = asyncio.run(_run())
+        assert other < 0.1
+        assert same >= 0.15
+
+    def test_backs_off_on_retry_after(self) -> None:
+        limiter = DomainRateLimiter(min_interval=0.0)
+        request = httpx.Request("GET", "https://a.com/x.pdf")
+        limiter.observe("a.com", httpx.Response(429, headers={"Retry-After": "0.2"}, request=request))
+
+        async def _run() -> float:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await limiter.acquire("a.com")
+            return loop.time() - start
+
+        assert asyncio.run(_run()) >= 0.15
+
+    def test_shared_across_event_loops(self) -> None:
+        limiter = DomainRateLimiter(min_interval=0.05)
+
+        async def _run() -> None:
+            # Contended, so the domain's lock gets bound to this loop
+            await asyncio.gather(*(limiter.acquire("a.com") for _ in range(3)))
+
+        asyncio.run(_run())
+        asyncio.run(_run())
+
 
 class TestExtractor:
     def test_extract_empty_pdf(self) -> None:
@@ -34,6 +191,94 @@ class TestExtractor:
         finally:
             path.unlink()
 
+    def test_extract_text_in_page_order(self, tmp_path: Path) -> None:
+        path = tmp_path / "doc.pdf"
+        _write_text_pdf(path, ["Alpha", "Bravo", "Charlie"])
+        text, pages, err = extract_text_from_pdf(path)
+        assert err is None
+        assert pages == 3
+        assert text.split("\n\n") == ["Alpha", "Bravo", "Charlie"]
+
+    @pytest.mark.parametrize(
+        "tier",
+        [(math.inf, "threads", {"workers": 3}), (math.inf, "processes", {"chunk_size": 5})],
+    )
+    def test_pooled_extraction_matches_sequential(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, tier: tuple
+    ) -> None:
+        path = tmp_path / "big.pdf"
+        _write_text_pdf(path, [f"Page{i}" for i in range(12)])
+        sequential = extract_text_from_pdf(path)
+        monkeypatch.setattr(extractor, "_STRATEGY_TIERS", [tier])
+        monkeypatch.setattr(extractor.os, "cpu_count", lambda: 4)
+        assert extract_text_from_pdf(path) == sequential
+
+    def test_falls_back_to_pypdf_when_pymupdf_fails(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        class _BrokenPymupdf:
+            @staticmethod
+            def open(path: str) -> None:
+                raise RuntimeError("cannot open")
+
+        path = tmp_path / "doc.pdf"
+        _write_text_pdf(path, ["Alpha"])
+        monkeypatch.setattr(extractor, "pymupdf", _BrokenPymupdf)
+        text, pages, err = extract_text_from_pdf(path)
+        assert (text, pages, err) == ("Alpha", 1, None)
+
+    def test_stops_extracting_once_max_chars_reached(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        path = tmp_path / "doc.pdf"
+        _write_text_pdf(path, ["Alpha", "Bravo", "Charlie"])
+        seen: list[int] = []
+        real_iter = extractor._iter_page_texts
+
+        def _tracking_iter(*args):
+            for text in real_iter(*args):
+                seen.append(1)
+                yield text
+
+        monkeypatch.setattr(extractor, "_iter_page_texts", _tracking_iter)
+        text, pages, err = extract_text_from_pdf(path, max_chars=8)
+        assert err is None
+        assert pages == 3
+        assert text == "Alpha\n\nB"
+        assert len(seen) == 2
+
+    def test_is_pdf_file_checks_magic_bytes(self, tmp_path: Path) -> None:
+        pdf = tmp_path / "download.bin"
+        pdf.write_bytes(b"%PDF-1.7 rest")
+        other = tmp_path / "page.bin"
+        other.write_bytes(b"<html>")
+        assert extractor._is_pdf_file(pdf) is True
+        assert extractor._is_pdf_file(other) is False
+        assert extractor._is_pdf_file(tmp_path / "missing.bin") is False
+
+    def test_extension_or_mime_skips_magic_probe(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        seen: list[Path] = []
+        monkeypatch.setattr(extractor, "_is_pdf_file", lambda p: seen.append(p) or False)
+        monkeypatch.setattr(extractor, "extract_text_from_pdf", lambda p, m: ("pdf", 1, None))
+        assert extractor.extract_text_from_file(tmp_path / "a.PDF")[0] == "pdf"
+        assert extractor.extract_text_from_file(tmp_path / "a.bin", "Application/PDF")[0] == "pdf"
+        assert seen == []
+        assert extractor.extract_text_from_file(tmp_path / "a.bin", "text/html")[2]
+        assert seen == [tmp_path / "a.bin"]
+
+    def test_reports_missing_pypdf(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(extractor, "pymupdf", None)
+        monkeypatch.setattr(extractor, "PdfReader", None)
+        assert extract_text_from_pdf(tmp_path / "doc.pdf") == ("", 0, "pypdf not installed")
+
+    def test_choose_strategy_by_page_count(self) -> None:
+        assert extractor._choose_strategy(3) == ("sequential", {})
+        assert extractor._choose_strategy(50)[0] == "threads"
+        assert extractor._choose_strategy(500) == ("processes", {"chunk_size": 200})
+        assert extractor._choose_strategy(5000) == ("processes", {"chunk_size": 500})
+
 
 class TestAttachmentCacheStore:
     def test_upsert_and_get(self) -> None:
@@ -56,3 +301,188 @@ class TestAttachmentCacheStore:
             assert cached.page_count == 1
         finally:
             db.unlink()
+
+    def test_get_cached_many(self, tmp_path: Path) -> None:
+        store = AttachmentCacheStore(tmp_path / "cache.db")
+        urls = [f"https://example.com/{i}.pdf" for i in range(1000)]
+        for url in urls[:3]:
+            store.upsert(url, "/cache/x.pdf", extraction_status="success", extracted_text=url)
+        store.upsert(urls[-1], "/cache/y.pdf")
+        found = store.get_cached_many(urls + [urls[0]])
+        assert set(found) == {urls[0], urls[1], urls[2], urls[-1]}
+        assert found[urls[1]].extracted_text == urls[1]
+        assert found[urls[-1]].extraction_status == "pending"
+        assert store.get_cached_many([]) == {}
+
+    def test_uses_wal_journal(self, tmp_path: Path) -> None:
+        AttachmentCacheStore(tmp_path / "cache.db")
+        with sqlite3.connect(tmp_path / "cache.db") as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_transaction_commits_once_and_rolls_back_on_error(self, tmp_path: Path) -> None:
+        store = AttachmentCacheStore(tmp_path / "cache.db")
+        other = AttachmentCacheStore(tmp_path / "cache.db")
+        with store.transaction():
+            store.upsert("https://example.com/a.pdf", "/cache/a.pdf")
+            store.upsert("https://example.com/b.pdf", "/cache/b.pdf")
+            assert store.get_cached("https://example.com/a.pdf") is not None
+            assert other.get_cached("https://example.com/a.pdf") is None  # not committed yet
+        urls = ["https://example.com/a.pdf", "https://example.com/b.pdf"]
+        assert set(other.get_cached_many(urls)) == set(urls)
+        with pytest.raises(RuntimeError):
+            with store.transaction():
+                store.upsert("https://example.com/c.pdf", "/cache/c.pdf")
+                raise RuntimeError("boom")
+        assert store.get_cached("https://example.com/c.pdf") is None
+
+
+class TestEnricher:
+    def test_enrich_uses_cached_text_in_attachment_order(self, tmp_path: Path) -> None:
+        store = AttachmentCacheStore(tmp_path / "cache.db")
+        for name in ("a", "b"):
+            store.upsert(
+                f"https://example.com/{name}.pdf",
+                f"/cache/{name}.pdf",
+                extraction_status="success",
+                extracted_text=f"text {name}",
+            )
+        opp = NormalizedOpportunity(
+            id="canadabuys:1",
+            source="canadabuys",
+            source_id="1",
+            summary="Main summary",
+            attachments=[
+                AttachmentRef(url="https://example.com/a.pdf"),
+                AttachmentRef(url="https://example.com/b.pdf", label="Spec"),
+            ],
+        )
+        text = enrich_opportunity(opp, tmp_path / "files", store, fetch_missing=False)
+        assert text.index("[Main]") < text.index("[Attachment: a.pdf]\ntext a")
+        assert text.index("text a") < text.index("[Attachment: Spec]\ntext b")
+
+    def test_enrich_opportunities_keeps_input_order(self, tmp_path: Path) -> None:
+        store = AttachmentCacheStore(tmp_path / "cache.db")
+        opps = []
+        for i in range(5):
+            url = f"https://example.com/{i}.pdf"
+            store.upsert(
+                url, f"/cache/{i}.pdf", extraction_status="success", extracted_text=f"text {i}"
+            )
+            opps.append(
+                NormalizedOpportunity(
+                    id=f"canadabuys:{i}",
+                    source="canadabuys",
+                    source_id=str(i),
+                    attachments=[AttachmentRef(url=url)],
+                )
+            )
+        texts = enrich_opportunities(opps, tmp_path / "files", store, concurrency=2)
+        assert [t.endswith(f"text {i}") for i, t in enumerate(texts)] == [True] * 5
+
+    def test_enrich_reuses_text_for_identical_content(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from rfp_finder.attachments import enricher
+
+        store = AttachmentCacheStore(tmp_path / "cache.db")
+        local = tmp_path / "rehosted.pdf"
+        local.write_bytes(b"%PDF-1.4 same bytes")
+        store.upsert(
+            "https://old.example.com/doc.pdf",
+            "/cache/old.pdf",
+            extraction_status="success",
+            extracted_text="already extracted",
+            page_count=3,
+            content_hash=enricher._file_sha256(local),
+        )
+
+        async def fake_fetch(url, cache_dir, **kwargs):
+            return local, None
+
+        def no_extract(*args, **kwargs):
+            raise AssertionError("identical content should not be re-extracted")
+
+        monkeypatch.setattr(enricher, "fetch_attachment_async", fake_fetch)
+        monkeypatch.setattr(enricher, "extract_text_from_file", no_extract)
+        opp = NormalizedOpportunity(
+            id="canadabuys:2",
+            source="canadabuys",
+            source_id="2",
+            attachments=[AttachmentRef(url="https://new.example.com/doc.pdf")],
+        )
+        text = enrich_opportunity(opp, tmp_path / "files", store)
+        assert "already extracted" in text
+        cached = store.get_cached("https://new.example.com/doc.pdf")
+        assert cached is not None
+        assert cached.extracted_text == "already extracted"
+        assert cached.page_count == 3
+        assert cached.content_hash == enricher._file_sha256(local)
+
+    def test_enrich_fetches_repeated_url_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from rfp_finder.attachments import enricher
+
+        local = tmp_path / "doc.pdf"
+        local.write_bytes(b"%PDF-1.4")
+        fetched: list[str] = []
+
+        async def fake_fetch(url, cache_dir, **kwargs):
+            fetched.append(url)
+            return local, None
+
+        monkeypatch.setattr(enricher, "fetch_attachment_async", fake_fetch)
+        monkeypatch.setattr(enricher, "extract_text_from_file", lambda *a: ("doc text", 1, None))
+        url = "https://example.com/doc.pdf"
+        opp = NormalizedOpportunity(
+            id="canadabuys:3",
+            source="canadabuys",
+            source_id="3",
+            attachments=[AttachmentRef(url=url), AttachmentRef(url=url, label="Again")],
+        )
+        text = enrich_opportunity(opp, tmp_path / "files", AttachmentCacheStore(tmp_path / "c.db"))
+        assert fetched == [url]
+        assert "[Attachment: doc.pdf]\ndoc text" in text
+        assert "[Attachment: Again]\ndoc text" in text
+
+    def test_enrich_opportunities_fetches_shared_url_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from rfp_finder.attachments import enricher
+
+        local = tmp_path / "terms.pdf"
+        local.write_bytes(b"%PDF-1.4")
+        fetched: list[str] = []
+
+        async def fake_fetch(url, cache_dir, **kwargs):
+            fetched.append(url)
+            await asyncio.sleep(0.01)  # both opportunities are in flight meanwhile
+            return local, None
+
+        monkeypatch.setattr(enricher, "fetch_attachment_async", fake_fetch)
+        monkeypatch.setattr(enricher, "extract_text_from_file", lambda *a: ("terms text", 1, None))
+        url = "https://example.com/terms.pdf"
+        opps = [
+            NormalizedOpportunity(
+                id=f"canadabuys:{i}",
+                source="canadabuys",
+                source_id=str(i),
+                attachments=[AttachmentRef(url=url)],
+            )
+            for i in range(2)
+        ]
+        store = AttachmentCacheStore(tmp_path / "c.db")
+        texts = enrich_opportunities(opps, tmp_path / "files", store, concurrency=2)
+        assert fetched == [url]
+        assert all(t.endswith("[Attachment: terms.pdf]\nterms text") for t in texts)
+        assert store.get_cached(url).extracted_text == "terms text"
+
+    def test_sync_wrapper_refuses_running_loop(self, tmp_path: Path) -> None:
+        opp = NormalizedOpportunity(id="canadabuys:4", source="canadabuys", source_id="4")
+        store = AttachmentCacheStore(tmp_path / "cache.db")
+
+        async def _run() -> None:
+            enrich_opportunity(opp, tmp_path / "files", store)
+
+        with pytest.raises(RuntimeError, match="enrich_opportunity_async"):
+            asyncio.run(_run())
@@ -1,7 +1,10 @@
 """Tests for Bids & Tenders connector."""
 
+import threading
+from datetime import datetime
 from unittest.mock import patch
 
+import httpx
 import pytest
 
 from rfp_finder.connectors.bidsandtenders import BidsTendersConnector
@@ -114,6 +117,28 @@ class TestBidsTendersConnectorSearch:
         assert len(raw_list) == 1
         assert raw_list[0].data["title"] == "Construction RFP"
 
+    @patch.object(BidsTendersConnector, "_bootstrap")
+    @patch.object(BidsTendersConnector, "_post_search")
+    def test_search_query_matches_any_field_not_across_fields(
+        self,
+        mock_post: object,
+        mock_bootstrap: object,
+        connector: BidsTendersConnector,
+    ) -> None:
+        """Query matches title, description or reference number, case-insensitively."""
+        mock_bootstrap.return_value = ("token", "guid")
+        mock_post.return_value = {
+            "success": True,
+            "total": 3,
+            "data": [
+                {"Id": "1", "Title": "Road", "Description": "Paving"},
+                {"Id": "2", "Title": "IT", "Description": "Software", "ReferenceNumber": "RFP-ROAD-7"},
+                {"Id": "3", "Title": "Ro", "Description": "ad"},
+            ],
+        }
+        raw_list = connector.search(query="ROAD")
+        assert [r.data["id"] for r in raw_list] == ["1", "2"]
+
 
 class TestBidsTendersConnectorFetchDetails:
     """Tests for fetch_details."""
@@ -142,10 +167,28 @@ class TestBidsTendersConnectorFetchDetails:
             connector.fetch_details("nonexistent")
 
 
+    @patch.object(BidsTendersConnector, "_search_single_tenant")
+    def test_fetch_details_crawls_tenant_once(
+        self,
+        mock_search_tenant: object,
+        connector: BidsTendersConnector,
+    ) -> None:
+        """Repeated lookups reuse one listing crawl per tenant."""
+        mock_search_tenant.return_value = [
+            RawOpportunity(data={"id": f"BT-{i}", "title": "Test", "_tenant": "bids"})
+            for i in range(3)
+        ]
+        assert connector.fetch_details("BT-2").data["id"] == "BT-2"
+        assert connector.fetch_details("bids:BT-0").data["id"] == "BT-0"
+        with pytest.raises(ValueError, match="Opportunity not found"):
+            connector.fetch_details("BT-9")
+        assert mock_search_tenant.call_count == 1
+
+
 class TestBidsTendersConnectorFetchAll:
     """Tests for fetch_all."""
 
-    @patch.object(BidsTendersConnector, "search")
+    @patch.object(BidsTendersConnector, "iter_search")
     def test_fetch_all_normalizes_results(
         self,
         mock_search: object,
@@ -159,3 +202,174 @@ class TestBidsTendersConnectorFetchAll:
         assert len(opps) == 1
         assert opps[0].source == "bidsandtenders"
         assert opps[0].source_id == "bids:1"
+
+
+class TestBidsTendersConnectorFetchIncremental:
+    """Tests for fetch_incremental."""
+
+    @patch.object(BidsTendersConnector, "iter_search")
+    def test_filters_by_publication_date(
+        self,
+        mock_search: object,
+        connector: BidsTendersConnector,
+    ) -> None:
+        mock_search.return_value = [
+            RawOpportunity(data={"id": "old", "date_published": "2026-01-05", "_tenant": "bids"}),
+            RawOpportunity(data={"id": "new", "date_published": "2026-02-05", "_tenant": "bids"}),
+            RawOpportunity(data={"id": "undated", "_tenant": "bids"}),
+        ]
+        opps = connector.fetch_incremental(since=datetime(2026, 2, 1))
+        assert [o.source_id for o in opps] == ["bids:new"]
+        assert opps[0].published_at == datetime(2026, 2, 5)
+
+
+class TestBidsTendersConnectorPagination:
+    """Tests for paged search."""
+
+    @staticmethod
+    def _page(start: int, limit: int, total: int) -> dict:
+        ids = range(start, min(start + limit, total))
+        return {
+            "success": True,
+            "total": total,
+            "data": [{"Id": f"BT-{i}", "Title": f"RFP {i}"} for i in ids],
+        }
+
+    @patch.object(BidsTendersConnector, "_bootstrap", return_value=("token", "guid"))
+    def test_fetches_all_pages_in_order(
+        self, mock_bootstrap: object, connector: BidsTendersConnector
+    ) -> None:
+        starts: list[int] = []
+
+        def _post(base_url, token, guid, *, status, limit, start):
+            starts.append(start)
+            return self._page(start, limit, total=23)
+
+        with patch.object(BidsTendersConnector, "_post_search", side_effect=_post):
+            raw_list = connector.search(filters={"limit": 5})
+        assert [r.data["id"] for r in raw_list] == [f"BT-{i}" for i in range(23)]
+        assert sorted(starts) == [0, 5, 10, 15, 20]
+
+    @patch.object(BidsTendersConnector, "_bootstrap", return_value=("token", "guid"))
+    def test_iter_search_yields_first_page_before_fetching_more(
+        self, mock_bootstrap: object, connector: BidsTendersConnector
+    ) -> None:
+        def _post(base_url, token, guid, *, status, limit, start):
+            return self._page(start, limit, total=50)
+
+        with patch.object(BidsTendersConnector, "_post_search", side_effect=_post) as mock_post:
+            records = connector.iter_search(filters={"limit": 10})
+            assert next(records).data["id"] == "BT-0"
+            assert mock_post.call_count == 1
+            assert len(list(records)) == 49
+
+    @patch.object(BidsTendersConnector, "_bootstrap", return_value=("token", "guid"))
+    def test_respects_max_results(
+        self, mock_bootstrap: object, connector: BidsTendersConnector
+    ) -> None:
+        def _post(base_url, token, guid, *, status, limit, start):
+            return self._page(start, limit, total=100)
+
+        with patch.object(BidsTendersConnector, "_post_search", side_effect=_post) as mock_post:
+            raw_list = connector.search(filters={"limit": 10, "max_results": 25})
+        assert len(raw_list) == 30
+        assert mock_post.call_count == 3
+
+    @patch.object(BidsTendersConnector, "_bootstrap", return_value=("token", "guid"))
+    def test_stops_at_first_failed_page(
+        self, mock_bootstrap: object, connector: BidsTendersConnector
+    ) -> None:
+        def _post(base_url, token, guid, *, status, limit, start):
+            if start == 10:
+                raise httpx.ConnectError("boom")
+            return self._page(start, limit, total=30)
+
+        with patch.object(BidsTendersConnector, "_post_search", side_effect=_post):
+            raw_list = connector.search(filters={"limit": 5})
+        assert [r.data["id"] for r in raw_list] == [f"BT-{i}" for i in range(10)]
+
+    @patch.object(BidsTendersConnector, "_bootstrap", return_value=("token", "guid"))
+    def test_partial_listing_is_not_cached_for_fetch_details(
+        self, mock_bootstrap: object, connector: BidsTendersConnector
+    ) -> None:
+        def _post(base_url, token, guid, *, status, limit, start):
+            if start == 25:
+                raise httpx.ConnectError("boom")
+            return self._page(start, limit, total=60)
+
+        with patch.object(BidsTendersConnector, "_post_search", side_effect=_post):
+            assert len(connector.search()) == 25
+        assert connector._details_indexes == {}
+
+    def test_searches_tenants_concurrently_in_order(self) -> None:
+        connector = BidsTendersConnector(tenants=["halifax", "bids", "ottawa"])
+        tenants = [t for t, _ in connector._base_urls]
+        # Every tenant must be in flight at once to get past the barrier
+        barrier = threading.Barrier(len(tenants), timeout=5)
+
+        def _search(tenant, base_url, query=None, filters=None):
+            barrier.wait()
+            return [RawOpportunity(data={"id": tenant, "_tenant": tenant})]
+
+        with patch.object(BidsTendersConnector, "_search_single_tenant", side_effect=_search):
+            raw_list = connector.search()
+        assert [r.data["id"] for r in raw_list] == tenants
+
+
+class TestBidsTendersConnectorSession:
+    """Tests for reuse of the bootstrapped (token, guid)."""
+
+    LISTING_HTML = (
+        '<input name="__RequestVerificationToken" type="hidden" value="tok" />'
+        '<input id="NodeId" value="f10c0dda-f64a-4cc5-a4f0-f0839866ab3b" />'
+    )
+
+    def _connector(self, expire_after: int | None = None) -> tuple[BidsTendersConnector, list[str]]:
+        """Connector on a mock transport; searches after expire_after get an HTML error page."""
+        calls: list[str] = []
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.method)
+            if request.method == "GET":
+                return httpx.Response(200, text=self.LISTING_HTML)
+            posts = calls.count("POST")
+            gets = calls.count("GET")
+            if expire_after is not None and posts > expire_after and gets == 1:
+                return httpx.Response(200, text="<html>session expired</html>")
+            return httpx.Response(
+                200, json={"success": True, "total": 1, "data": [{"Id": "BT-1", "Title": "T"}]}
+            )
+
+        client = httpx.Client(transport=httpx.MockTransport(_handler))
+        return BidsTendersConnector(tenant="bids", client=client), calls
+
+    def test_reuses_bootstrap_across_searches(self) -> None:
+        connector, calls = self._connector()
+        assert len(connector.search()) == 1
+        assert len(connector.search()) == 1
+        assert calls == ["GET", "POST", "POST"]
+
+    def test_rebootstraps_when_reused_session_is_rejected(self) -> None:
+        connector, calls = self._connector(expire_after=1)
+        assert len(connector.search()) == 1
+        assert len(connector.search()) == 1
+        assert calls == ["GET", "POST", "POST", "GET", "POST"]
+
+    def test_bootstraps_again_after_ttl(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        connector, calls = self._connector()
+        monkeypatch.setattr(BidsTendersConnector, "SESSION_TTL", 0.0)
+        connector.search()
+        connector.search()
+        assert calls == ["GET", "POST", "GET", "POST"]
+
+    def test_fetch_details_reuses_full_search(self) -> None:
+        connector, calls = self._connector()
+        connector.search()
+        assert connector.fetch_details("bids:BT-1").data["title"] == "T"
+        assert calls == ["GET", "POST"]
+
+    def test_fetch_details_crawls_after_filtered_search(self) -> None:
+        connector, calls = self._connector()
+        connector.search(query="nothing matches")
+        assert connector.fetch_details("BT-1").data["id"] == "BT-1"
+        assert calls == ["GET", "POST", "POST"]
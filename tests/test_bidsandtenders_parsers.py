@@ -1,10 +1,13 @@
 """Tests for Bids & Tenders parsers."""
 
+from datetime import datetime
+
 import pytest
 
 from rfp_finder.connectors.bidsandtenders.parsers import (
     extract_csrf_token,
     extract_search_guid,
+    parse_datetime,
     raw_from_search_item,
 )
 
@@ -79,5 +82,29 @@ class TestRawFromSearchItem:
 
     def test_preserves_raw_item(self) -> None:
         item = {"Id": "x", "CustomField": "value"}
-        raw = raw_from_search_item(item)
+        raw = raw_from_search_item(item, keep_raw=True)
         assert raw["_raw"] == item
+
+    def test_omits_raw_item_by_default(self) -> None:
+        raw = raw_from_search_item({"Id": "x", "CustomField": "value"})
+        assert "_raw" not in raw
+
+
+class TestParseDatetime:
+    """Tests for parse_datetime."""
+
+    def test_iso_formats(self) -> None:
+        assert parse_datetime("2026-03-09T14:00:00") == datetime(2026, 3, 9, 14, 0)
+        assert parse_datetime("2026-03-09") == datetime(2026, 3, 9)
+        assert parse_datetime("2026-03-09T14:00:00-04:00") == datetime(2026, 3, 9, 18, 0)
+
+    def test_aspnet_date(self) -> None:
+        assert parse_datetime("/Date(1767225600000)/") == datetime(2026, 1, 1)
+        assert parse_datetime("/Date(1767225600000-0500)/") == datetime(2026, 1, 1)
+
+    def test_missing_or_invalid(self) -> None:
+        assert parse_datetime(None) is None
+        assert parse_datetime("") is None
+        assert parse_datetime("next week") is None
+        assert parse_datetime(1767225600000) is None
+
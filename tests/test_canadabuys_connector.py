@@ -3,6 +3,7 @@
 from datetime import datetime
 from unittest.mock import patch
 
+import httpx
 import pytest
 
 from rfp_finder.connectors.canadabuys import CanadaBuysConnector
@@ -61,11 +62,31 @@ class TestCanadaBuysConnectorNormalize:
         assert opp.source_id == "S12345"
         assert opp.id == "canadabuys:S12345"
 
+    @pytest.mark.parametrize(
+        "notice_url, expected",
+        [
+            ("/en/tender-opportunities/cb-1", "https://canadabuys.canada.ca/en/tender-opportunities/cb-1"),
+            ("en/notice", "https://canadabuys.canada.ca/en/notice"),
+            ("//example.org/notice", "https://example.org/notice"),
+            ("https://example.org/notice", "https://example.org/notice"),
+        ],
+    )
+    def test_resolves_relative_notice_url(
+        self, connector: CanadaBuysConnector, notice_url: str, expected: str
+    ) -> None:
+        """Relative notice URLs resolve against the site, absolute ones are kept."""
+        raw = RawOpportunity(data={
+            "referenceNumber-numeroReference": "cb-1",
+            "title-titre-eng": "Test",
+            "noticeURL-URLavis-eng": notice_url,
+        })
+        assert connector.normalize(raw).url == expected
+
 
 class TestCanadaBuysConnectorSearch:
     """Tests for search with mocked HTTP."""
 
-    @patch("rfp_finder.connectors.canadabuys.connector.CanadaBuysConnector._fetch_csv")
+    @patch("rfp_finder.connectors.canadabuys.connector.CanadaBuysConnector._iter_csv_lines")
     def test_search_returns_raw_list(
         self,
         mock_fetch,
@@ -73,7 +94,53 @@ class TestCanadaBuysConnectorSearch:
         sample_canadabuys_csv_content: str,
     ) -> None:
         """Search fetches CSV and parses rows."""
-        mock_fetch.return_value = sample_canadabuys_csv_content
+        mock_fetch.return_value = sample_canadabuys_csv_content.splitlines(keepends=True)
         raw_list = connector.search()
         assert len(raw_list) == 1
         assert raw_list[0].data.get("referenceNumber-numeroReference") == "cb-233-49083652"
+
+    def test_streams_csv_with_multiline_fields(self) -> None:
+        """Rows parse the same when the CSV arrives in small chunks split mid-field."""
+        body = (
+            'title-titre-eng,tenderDescription-descriptionAppelOffres-eng\r\n'
+            '"Roof repair","Line one\r\nline two"\r\n'
+            'Paving,"Spring, 2026"\r\n'
+        ).encode()
+        chunks = [body[i : i + 7] for i in range(0, len(body), 7)]
+        client = httpx.Client(
+            transport=httpx.MockTransport(lambda req: httpx.Response(200, content=iter(chunks)))
+        )
+        raw_list = CanadaBuysConnector(client=client).search()
+        assert [r.data["title-titre-eng"] for r in raw_list] == ["Roof repair", "Paving"]
+        assert raw_list[0].data["tenderDescription-descriptionAppelOffres-eng"] == (
+            "Line one\r\nline two"
+        )
+        assert raw_list[1].data["tenderDescription-descriptionAppelOffres-eng"] == "Spring, 2026"
+
+    @patch("rfp_finder.connectors.canadabuys.connector.CanadaBuysConnector._iter_csv_lines")
+    def test_search_query_matches_title_or_description_only(
+        self, mock_fetch, connector: CanadaBuysConnector
+    ) -> None:
+        """Query matches title/description case-insensitively, not other columns."""
+        mock_fetch.return_value = [
+            "title-titre-eng,tenderDescription-descriptionAppelOffres-eng,"
+            "referenceNumber-numeroReference\n",
+            "Roof Repair,,ROOF-1\n",
+            "Paving,Asphalt and roof drains,PAVE-1\n",
+            "Snow removal,Winter,ROOF-2\n",
+            "Short row\n",
+        ]
+        raw_list = connector.search(query="roof")
+        assert [r.data["referenceNumber-numeroReference"] for r in raw_list] == ["ROOF-1", "PAVE-1"]
+        all_rows = connector.search()
+        assert all_rows[-1].data == {
+            "title-titre-eng": "Short row",
+            "tenderDescription-descriptionAppelOffres-eng": None,
+            "referenceNumber-numeroReference": None,
+        }
+
+    def test_connectors_share_default_client(self) -> None:
+        """Instances without an injected client reuse one pooled client."""
+        assert CanadaBuysConnector()._client is CanadaBuysConnector()._client
+        injected = httpx.Client()
+        assert CanadaBuysConnector(client=injected)._client is injected
@@ -26,6 +26,14 @@ class TestParseDate:
         """Parses date-only format."""
         assert parse_date("2026-02-20") == datetime(2026, 2, 20, 0, 0, 0)
 
+    def test_other_formats_and_invalid_dates(self) -> None:
+        """Falls back to strptime formats; impossible dates give None."""
+        assert parse_date("2026/02/20") == datetime(2026, 2, 20)
+        assert parse_date("2026-2-5") == datetime(2026, 2, 5)
+        assert parse_date(" 2026-03-09T14:00:00.000Z ") == datetime(2026, 3, 9, 14, 0, 0)
+        assert parse_date("2026-02-30") is None
+        assert parse_date("2026-W08-5") is None
+
     def test_empty_string(self) -> None:
         """Returns None for empty string."""
         assert parse_date("") is None
@@ -112,6 +120,14 @@ class TestParseTradeAgreements:
         """Returns None for empty input."""
         assert parse_trade_agreements(None) is None
         assert parse_trade_agreements("") is None
+        assert parse_trade_agreements("\n*\n") is None
+
+    def test_repeated_value_returns_independent_lists(self) -> None:
+        """Cached parses still hand each caller its own list."""
+        first = parse_trade_agreements("*CFTA\n*CPTPP")
+        assert first == ["CFTA", "CPTPP"]
+        first.append("mutated")
+        assert parse_trade_agreements("*CFTA\n*CPTPP") == ["CFTA", "CPTPP"]
 
 
 class TestContentHash:
@@ -131,3 +147,15 @@ class TestContentHash:
         raw1 = RawOpportunity(data={"title-titre-eng": "Foo"})
         raw2 = RawOpportunity(data={"title-titre-eng": "Bar"})
         assert content_hash(raw1) != content_hash(raw2)
+
+    def test_hash_is_stable_across_versions(self) -> None:
+        """Hashes already stored for change detection must keep matching."""
+        raw = RawOpportunity(
+            data={
+                "title-titre-eng": "Foo",
+                "tenderDescription-descriptionAppelOffres-eng": "Bär",
+            }
+        )
+        assert content_hash(raw) == (
+            "b0f95e4aaa9519421930831ec46a4600fcb81e64b34504f2ace0116dc8f0ff75"
+        )
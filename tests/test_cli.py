@@ -0,0 +1,358 @@
+"""Tests for CLI helpers."""
+
+import argparse
+import io
+import json
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from rfp_finder.cli import output as cli_output
+from rfp_finder.cli.main import _build_parser, _parse_date, _parse_store_fast, main
+from rfp_finder.cli.output import (
+    _read_opportunities,
+    _read_records,
+    _stream_dump,
+    _write_output,
+)
+
+
+RECORDS = [
+    {"id": "a", "title": "Line\nbreak", "tags": ["x", "y"], "nested": {"k": 1}},
+    {"id": "b", "title": "Second", "tags": [], "nested": {}},
+]
+
+
+@pytest.fixture(params=["orjson", "json"])
+def serializer(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run each output test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "orjson" and cli_output._orjson() is None:
+        pytest.skip("orjson not installed")
+    if request.param == "json":
+        monkeypatch.setattr(cli_output, "_orjson", lambda: None)
+    return request.param
+
+
+@pytest.mark.usefixtures("serializer")
+class TestStreamDump:
+    @pytest.mark.parametrize("records", [RECORDS, RECORDS[:1], []])
+    def test_json_matches_json_dumps(self, records: list[dict]) -> None:
+        fp = io.StringIO()
+        count = _stream_dump(iter(records), fp, "json")
+        assert count == len(records)
+        assert fp.getvalue() == json.dumps(records, indent=2, default=str) + "\n"
+
+    def test_jsonl_one_record_per_line(self) -> None:
+        fp = io.StringIO()
+        assert _stream_dump(iter(RECORDS), fp, "jsonl") == 2
+        lines = fp.getvalue().splitlines()
+        assert [json.loads(line) for line in lines] == RECORDS
+
+    def test_non_json_values_use_str(self) -> None:
+        fp = io.StringIO()
+        _stream_dump(iter([{"when": datetime(2026, 3, 9), 1: "int key"}]), fp, "jsonl")
+        assert json.loads(fp.getvalue()) == {"when": "2026-03-09 00:00:00", "1": "int key"}
+
+    @pytest.mark.parametrize("fmt", ["json", "jsonl"])
+    def test_models_serialize_like_json_mode_dumps(self, fmt: str) -> None:
+        from rfp_finder.models.opportunity import AttachmentRef, NormalizedOpportunity
+
+        opps = [
+            NormalizedOpportunity(
+                id="canadabuys:1",
+                source="canadabuys",
+                source_id="1",
+                title="Café renovation",
+                closing_at=datetime(2026, 3, 9, 14, 0),
+                attachments=[AttachmentRef(url="https://example.com/a.pdf")],
+            )
+        ]
+        from_models, from_dicts = io.StringIO(), io.StringIO()
+        _stream_dump(iter(opps), from_models, fmt)
+        _stream_dump((o.model_dump(mode="json") for o in opps), from_dicts, fmt)
+        def parse(text: str) -> list:
+            if fmt == "jsonl":
+                return [json.loads(line) for line in text.splitlines()]
+            return json.loads(text)
+
+        assert parse(from_models.getvalue()) == parse(from_dicts.getvalue())
+        assert len(from_models.getvalue().splitlines()) == len(from_dicts.getvalue().splitlines())
+
+    def test_read_records_handles_utf8_and_blank_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "in.jsonl"
+        path.write_text('{"title": "Café"}\n\n{"title": "Zoë"}\n', encoding="utf-8")
+        assert _read_records(path) == [{"title": "Café"}, {"title": "Zoë"}]
+
+    @pytest.mark.parametrize("fmt", ["json", "jsonl"])
+    def test_write_then_read_round_trip(self, tmp_path: Path, fmt: str) -> None:
+        out = tmp_path / f"out.{fmt}"
+        assert _write_output(iter(RECORDS), out, fmt) == 2
+        assert _read_records(out) == RECORDS
+
+    @pytest.mark.parametrize("fmt", ["json", "jsonl"])
+    def test_read_opportunities_round_trip(self, tmp_path: Path, fmt: str) -> None:
+        from rfp_finder.models.opportunity import NormalizedOpportunity
+
+        opps = [
+            NormalizedOpportunity(
+                id=f"x:{i}",
+                source="x",
+                source_id=str(i),
+                title=f"Tender {i}",
+                closing_at=datetime(2026, 3, 9, 17, 0),
+            )
+            for i in range(3)
+        ]
+        out = tmp_path / f"out.{fmt}"
+        _write_output(opps, out, fmt)
+        assert _read_opportunities(out) == opps
+
+
+def test_cli_import_and_help_skip_heavy_modules() -> None:
+    code = (
+        "import sys\n"
+        "sys.argv = ['rfp-finder', '--help']\n"
+        "from rfp_finder.cli.main import main\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "heavy = {'httpx', 'pydantic', 'pypdf', 'yaml', 'dotenv', 'rfp_finder.store',\n"
+        "         'json', 'datetime', 'orjson'}\n"
+        "print(sorted(heavy & set(sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_store_count_imports_only_store_command(tmp_path: Path) -> None:
+    db = tmp_path / "rfp.db"
+    code = (
+        "import sys\n"
+        "from rfp_finder.cli.main import main\n"
+        f"main(['store', 'count', '--db', {str(db)!r}])\n"
+        "unused = {'httpx', 'yaml', 'rfp_finder.filtering', 'rfp_finder.scoring',\n"
+        "          'rfp_finder.connectors', 'rfp_finder.cli.commands.filter'}\n"
+        "print(sorted(unused & set(sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip().splitlines() == ["0", "[]"]
+
+
+class TestParseDate:
+    def test_valid_date(self) -> None:
+        assert _parse_date("2026-03-09") == datetime(2026, 3, 9)
+
+    def test_invalid_date_is_argparse_error(self) -> None:
+        with pytest.raises(argparse.ArgumentTypeError, match="YYYY-MM-DD"):
+            _parse_date("09/03/2026")
+
+
+class TestParser:
+    def test_only_invoked_command_gets_arguments(self) -> None:
+        parser = _build_parser("store")
+        args = parser.parse_args(["store", "count", "--status", "open"])
+        assert (args.command, args.action, args.status) == ("store", "count", "open")
+        with pytest.raises(SystemExit):
+            parser.parse_args(["ingest", "--source", "canadabuys"])
+
+    def test_ingest_defaults(self) -> None:
+        args = _build_parser("ingest").parse_args(["ingest"])
+        assert args.source == "canadabuys"
+        assert args.since is None
+        assert args.format == "json"
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["store", "count"],
+            ["store", "list", "--status", "open"],
+            ["store", "--db=x.db", "list", "--format", "jsonl"],
+            ["store", "count", "--db", "x.db", "--status=closed"],
+        ],
+    )
+    def test_store_fast_path_matches_argparse(self, argv: list[str]) -> None:
+        fast = _parse_store_fast(argv)
+        assert fast is not None
+        assert fast == _build_parser("store").parse_args(argv)
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["store"],
+            ["store", "list", "--help"],
+            ["store", "list", "--stat", "open"],
+            ["store", "list", "--format", "xml"],
+            ["store", "list", "--db"],
+            ["store", "list", "count"],
+            ["filter", "--profile", "p.yaml"],
+        ],
+    )
+    def test_store_fast_path_defers_to_argparse(self, argv: list[str]) -> None:
+        assert _parse_store_fast(argv) is None
+
+    def test_main_dispatches_to_command_module(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        seen: list[argparse.Namespace] = []
+        monkeypatch.setattr("rfp_finder.cli.commands.tenants.run", seen.append)
+        main(["tenants", "--province", "ON"])
+        assert [(a.command, a.province) for a in seen] == [("tenants", "ON")]
+
+    def test_version(self, capsys: pytest.CaptureFixture[str]) -> None:
+        from rfp_finder import __version__
+
+        with pytest.raises(SystemExit) as exc:
+            main(["--version"])
+        assert exc.value.code == 0
+        assert capsys.readouterr().out.strip() == f"rfp-finder {__version__}"
+
+
+def test_print_filter_stats_counts_first_failing_rule(capsys: pytest.CaptureFixture[str]) -> None:
+    from types import SimpleNamespace
+
+    from rfp_finder.cli.commands.filter import _exclusion_reasons, _print_filter_stats
+
+    results = [
+        SimpleNamespace(passed=True, excluded_by_rule=None),
+        SimpleNamespace(passed=False, excluded_by_rule="region"),
+        SimpleNamespace(passed=False, excluded_by_rule="region"),
+        SimpleNamespace(passed=False, excluded_by_rule=None),
+    ]
+    _print_filter_stats(len(results), _exclusion_reasons(results))
+    out = capsys.readouterr().out
+    assert "Filter stats: 1/4 passed" in out
+    assert "Excluded by region: 2 (50.0%)" in out
+    assert "Excluded by other: 1 (25.0%)" in out
+
+
+def test_run_filter_streams_from_store(tmp_path: Path) -> None:
+    from rfp_finder.cli.commands.filter import run as _run_filter
+    from rfp_finder.models.opportunity import NormalizedOpportunity
+    from rfp_finder.models.profile import UserProfile
+    from rfp_finder.store import OpportunityStore
+
+    db = tmp_path / "rfp.db"
+    store = OpportunityStore(db)
+    for i, title in enumerate(["AI platform", "Road paving", "AI analytics"]):
+        store.upsert(
+            NormalizedOpportunity(id=f"x:{i}", source="x", source_id=str(i), title=title)
+        )
+    profile = tmp_path / "profile.yaml"
+    profile.write_text("profile_id: t\nkeywords: [AI]\n")
+    out = tmp_path / "out.json"
+    args = argparse.Namespace(
+        profile=profile,
+        db=db,
+        input=None,
+        status=None,
+        output=out,
+        show_explanations=False,
+        stats=False,
+        format="json",
+    )
+    _run_filter(args)
+    assert sorted(o["id"] for o in _read_records(out)) == ["x:0", "x:2"]
+    cache_key = store.filter_cache_key(UserProfile.from_yaml(profile), None)
+    assert sorted(store.get_filter_cache(cache_key)) == ["x:0", "x:2"]
+
+
+def test_run_score_rechecks_deadline_on_cached_filter(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from datetime import datetime, timedelta, timezone
+
+    from rfp_finder.cli.commands.score import run as _run_score
+    from rfp_finder.models.opportunity import NormalizedOpportunity
+    from rfp_finder.models.profile import UserProfile
+    from rfp_finder.store import OpportunityStore
+
+    monkeypatch.delenv("RFP_FINDER_LLM_PROVIDER", raising=False)
+    db = tmp_path / "rfp.db"
+    store = OpportunityStore(db)
+    now = datetime.now(timezone.utc)
+    for i, closing in enumerate([now + timedelta(days=5), now - timedelta(hours=1)]):
+        store.upsert(
+            NormalizedOpportunity(
+                id=f"x:{i}", source="x", source_id=str(i), title="AI platform", closing_at=closing
+            )
+        )
+    profile = tmp_path / "profile.yaml"
+    profile.write_text("profile_id: t\nkeywords: [AI]\nmax_days_to_close: 30\n")
+    # Cached earlier today, while x:1 was still open
+    store.put_filter_cache(
+        store.filter_cache_key(UserProfile.from_yaml(profile), "open"), ["x:0", "x:1"]
+    )
+    out = tmp_path / "scored.json"
+    args = argparse.Namespace(
+        profile=profile, db=db, input=None, top=10, output=out, format="json", enrich_top=0
+    )
+    _run_score(args)
+    assert [r["opportunity"]["id"] for r in _read_records(out)] == ["x:0"]
+
+
+def test_closed_stdout_pipe_exits_quietly(tmp_path: Path) -> None:
+    from rfp_finder.models.opportunity import NormalizedOpportunity
+    from rfp_finder.store import OpportunityStore
+
+    db = tmp_path / "rfp.db"
+    # Well past the OS pipe buffer, so writes fail once the reader has gone
+    OpportunityStore(db).upsert_many(
+        NormalizedOpportunity(
+            id=f"x:{i}", source="x", source_id=str(i), title="t", summary="s" * 1000
+        )
+        for i in range(500)
+    )
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "rfp_finder.cli.main", "store", "list", "--db", str(db)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    proc.stdout.readline()
+    proc.stdout.close()
+    stderr = proc.stderr.read().decode()
+    assert proc.wait() == 1
+    assert "Traceback" not in stderr
+
+
+def test_store_list_jsonl_copies_stored_json(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    from rfp_finder.models.opportunity import NormalizedOpportunity
+    from rfp_finder.store import OpportunityStore
+
+    db = tmp_path / "rfp.db"
+    OpportunityStore(db).upsert_many(
+        NormalizedOpportunity(id=f"x:{i}", source="x", source_id=str(i), title=f"Tender é{i}")
+        for i in range(3)
+    )
+    main(["store", "list", "--db", str(db), "--format", "jsonl"])
+    jsonl = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    main(["store", "list", "--db", str(db)])
+    assert jsonl == json.loads(capsys.readouterr().out)
+    assert len(jsonl) == 3
+
+
+def test_filter_empty_store_exits_before_loading_profile(tmp_path: Path) -> None:
+    args = argparse.Namespace(
+        profile=tmp_path / "missing.yaml",
+        db=tmp_path / "empty.db",
+        input=None,
+        status=None,
+        output=None,
+        show_explanations=False,
+        stats=False,
+        format="json",
+    )
+    from rfp_finder.cli.commands.filter import run as _run_filter
+
+    with pytest.raises(SystemExit) as exc:
+        _run_filter(args)
+    assert exc.value.code == 1
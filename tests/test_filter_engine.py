@@ -43,6 +43,15 @@ class TestFilterEngine:
         assert result.opportunity == opp
         assert len(result.explanations) >= 4
 
+    def test_filter_result_serializes(self, permissive_profile: UserProfile) -> None:
+        """FilterResult stays a pydantic model: callers serialize it with model_dump."""
+        result = FilterEngine(permissive_profile).filter(_make_opp())
+        data = result.model_dump(mode="json")
+        assert set(data) == {
+            "passed", "explanations", "eligibility", "opportunity", "excluded_by_rule"
+        }
+        assert data["opportunity"]["id"] == result.opportunity.id
+
     def test_filter_passed_includes_matching_opp(self, permissive_profile: UserProfile) -> None:
         """filter_passed returns only results that passed."""
         engine = FilterEngine(permissive_profile)
@@ -62,3 +71,79 @@ class TestFilterEngine:
         assert len(results) == 2
         assert results[0].opportunity.id == "a"
         assert results[1].opportunity.id == "b"
+
+    def test_filter_iter_is_lazy_and_matches_filter_many(
+        self, permissive_profile: UserProfile
+    ) -> None:
+        """filter_iter consumes its input lazily and yields the same results as filter_many."""
+        engine = FilterEngine(permissive_profile)
+        opps = [_make_opp(id=f"canadabuys:{i}", source_id=str(i)) for i in range(3)]
+        consumed: list[str] = []
+
+        def _source():
+            for opp in opps:
+                consumed.append(opp.id)
+                yield opp
+
+        it = engine.filter_iter(_source())
+        first = next(it)
+        assert consumed == ["canadabuys:0"]
+        rest = list(it)
+        assert [first, *rest] == engine.filter_many(opps)
+
+    def test_closing_window_covers_deadline_rule(self) -> None:
+        """Anything the deadline rule passes closes inside closing_window."""
+        profile = UserProfile(profile_id="test", max_days_to_close=10)
+        engine = FilterEngine(profile)
+        now = datetime.now(timezone.utc)
+        earliest, latest = engine.closing_window(now)
+        for hours in (1, 24 * 5, 24 * 10 + 23):
+            opp = _make_opp(closing_at=now + timedelta(hours=hours))
+            assert engine.filter(opp).passed
+            assert earliest <= opp.closing_at <= latest
+        assert FilterEngine(UserProfile(profile_id="test")).closing_window() is None
+
+    def test_filter_many_parallel_matches_filter_many(self) -> None:
+        """Pool path returns the same results, in input order."""
+        profile = UserProfile(profile_id="test", keywords=["AI"], eligible_regions=["ON"])
+        engine = FilterEngine(profile)
+        opps = [
+            _make_opp(
+                id=f"canadabuys:{i}",
+                source_id=str(i),
+                title="AI tools" if i % 2 else "Road paving",
+                region="Ontario" if i % 3 else "Yukon",
+            )
+            for i in range(10)
+        ]
+        parallel = engine.filter_many_parallel(opps, workers=2, chunk_size=3, min_items=0)
+        assert parallel == engine.filter_many(opps)
+
+    def test_filter_many_parallel_small_input_stays_sequential(
+        self, permissive_profile: UserProfile, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from rfp_finder.filtering import engine as engine_module
+
+        def _no_pool(*args, **kwargs):
+            raise AssertionError("pool started for a small input")
+
+        monkeypatch.setattr(engine_module, "ProcessPoolExecutor", _no_pool)
+        engine = FilterEngine(permissive_profile)
+        assert len(engine.filter_many_parallel([_make_opp()], workers=4)) == 1
+
+    def test_fast_reject_stops_at_first_failing_rule(self) -> None:
+        """fast_reject keeps passes and first-failing rule, trims rejected results."""
+        profile = UserProfile(profile_id="test", keywords=["AI"], eligible_regions=["ON"])
+        opps = [
+            _make_opp(id="pass", title="AI tools", region="Ontario"),
+            _make_opp(id="region", title="AI tools", region="Yukon"),
+            _make_opp(id="keywords", title="Road paving", region="Ontario"),
+        ]
+        full = FilterEngine(profile).filter_many(opps)
+        fast = FilterEngine(profile, fast_reject=True).filter_many(opps)
+        assert fast[0] == full[0]
+        assert [r.excluded_by_rule for r in fast] == [r.excluded_by_rule for r in full]
+        assert [r.passed for r in fast] == [r.passed for r in full]
+        assert fast[1].explanations == full[1].explanations[:1]
+        assert fast[2].explanations == full[2].explanations[:2]
+        assert fast[1].eligibility == "unknown"
@@ -5,7 +5,9 @@ from decimal import Decimal
 
 import pytest
 
+from rfp_finder.filtering import rules
 from rfp_finder.filtering.rules import (
+    ProfileTerms,
     apply_budget_rule,
     apply_deadline_rule,
     apply_eligibility_rule,
@@ -110,6 +112,39 @@ class TestKeywordsRule:
         assert passed is True
         assert "optional" in exp.lower() or "AI" in exp
 
+    def test_precomputed_terms_match_profile(self) -> None:
+        """Rules given ProfileTerms give the same verdicts as rules given only the profile."""
+        profile = _make_profile(
+            keywords=["Cloud", "AI"], exclude_keywords=["construction"], eligible_regions=["on"]
+        )
+        terms = ProfileTerms.from_profile(profile)
+        for opp in (
+            _make_opp(title="AI platform", region="*Ontario (except NCR)"),
+            _make_opp(title="Cloud migration", region="QC"),
+            _make_opp(title="Construction of AI lab", region="ON"),
+            _make_opp(title="Office supplies", region="National"),
+        ):
+            for rule in (apply_keywords_rule, apply_region_rule):
+                assert rule(opp, profile, terms=terms) == rule(opp, profile)
+
+    @pytest.mark.parametrize("use_hyperscan", [True, False])
+    def test_reports_first_profile_keyword(self, monkeypatch, use_hyperscan: bool) -> None:
+        """Matching names the first profile keyword found, with or without hyperscan."""
+        if use_hyperscan and rules.hyperscan is None:
+            pytest.skip("hyperscan not installed")
+        if not use_hyperscan:
+            monkeypatch.setattr(rules, "hyperscan", None)
+        rules._keyword_scanner.cache_clear()
+        profile = _make_profile(keywords=["Réseau", "cloud", "a.i"])
+        passed, exp, _ = apply_keywords_rule(
+            _make_opp(title="Cloud services", summary="Services de réseau"), profile
+        )
+        assert passed is True
+        assert exp == "Matches keyword: Réseau"
+        passed, _, _ = apply_keywords_rule(_make_opp(title="Rain gauges"), profile)
+        assert passed is False
+        rules._keyword_scanner.cache_clear()
+
 
 class TestDeadlineRule:
     """Tests for apply_deadline_rule."""
@@ -38,10 +38,10 @@ class TestIngestStoreIntegration:
     ) -> None:
         """Ingest with --store persists to SQLite and reports counts."""
         with patch(
-            "rfp_finder.connectors.canadabuys.connector.CanadaBuysConnector._fetch_csv",
-            return_value=sample_csv_content,
+            "rfp_finder.connectors.canadabuys.connector.CanadaBuysConnector._iter_csv_lines",
+            return_value=sample_csv_content.splitlines(keepends=True),
         ):
-            from rfp_finder.cli.main import _run_ingest
+            from rfp_finder.cli.commands.ingest import run as _run_ingest
             from argparse import Namespace
 
             args = Namespace(
@@ -65,10 +65,10 @@ class TestIngestStoreIntegration:
     ) -> None:
         """Second ingest with same data reports 0 new, 0 amended."""
         with patch(
-            "rfp_finder.connectors.canadabuys.connector.CanadaBuysConnector._fetch_csv",
-            return_value=sample_csv_content,
+            "rfp_finder.connectors.canadabuys.connector.CanadaBuysConnector._iter_csv_lines",
+            return_value=sample_csv_content.splitlines(keepends=True),
         ):
-            from rfp_finder.cli.main import _run_ingest
+            from rfp_finder.cli.commands.ingest import run as _run_ingest
             from argparse import Namespace
 
             args = Namespace(
@@ -93,10 +93,10 @@ class TestIngestStoreIntegration:
     ) -> None:
         """Persisted data is queryable via store list/count."""
         with patch(
-            "rfp_finder.connectors.canadabuys.connector.CanadaBuysConnector._fetch_csv",
-            return_value=sample_csv_content,
+            "rfp_finder.connectors.canadabuys.connector.CanadaBuysConnector._iter_csv_lines",
+            return_value=sample_csv_content.splitlines(keepends=True),
         ):
-            from rfp_finder.cli.main import _run_ingest
+            from rfp_finder.cli.commands.ingest import run as _run_ingest
             from argparse import Namespace
 
             args = Namespace(
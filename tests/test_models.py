@@ -107,3 +107,10 @@ class TestRawOpportunity:
         raw = RawOpportunity(data={"title": "Foo", "ref": "123"})
         assert raw.data["title"] == "Foo"
         assert raw.data["ref"] == "123"
+
+    def test_from_dict_wraps_without_copying(self) -> None:
+        """from_dict keeps the given dict as data."""
+        data = {"title": "Foo"}
+        raw = RawOpportunity.from_dict(data)
+        assert raw.data is data
+        assert raw == RawOpportunity(data={"title": "Foo"})
@@ -1,5 +1,6 @@
 """Unit tests for UserProfile."""
 
+import os
 import tempfile
 from pathlib import Path
 
@@ -59,3 +60,32 @@ max_days_to_close: 28
         assert profile.max_days_to_close == 28
         assert profile.min_budget == 25000
         assert profile.max_budget == 750000
+
+    def test_from_yaml_caches_until_file_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Unchanged files are parsed once; edits are picked up; callers get copies."""
+        import rfp_finder.models.profile as profile_module
+
+        path = tmp_path / "profile.yaml"
+        path.write_text("profile_id: cached\nkeywords: [AI]\n")
+        calls: list[str] = []
+        parse = UserProfile._parse_yaml.__func__
+        monkeypatch.setattr(
+            UserProfile,
+            "_parse_yaml",
+            classmethod(lambda cls, p: calls.append(str(p)) or parse(cls, p)),
+        )
+        profile_module._load_profile.cache_clear()
+
+        first = UserProfile.from_yaml(path)
+        first.keywords.append("mutated")
+        second = UserProfile.from_yaml(str(path))
+        assert len(calls) == 1
+        assert second.keywords == ["AI"]
+
+        path.write_text("profile_id: cached\nkeywords: [AI, ML]\n")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert UserProfile.from_yaml(path).keywords == ["AI", "ML"]
+        assert len(calls) == 2
@@ -1,5 +1,6 @@
 """Unit tests for OpportunityStore."""
 
+import sqlite3
 import tempfile
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -7,7 +8,7 @@ from pathlib import Path
 import pytest
 
 from rfp_finder.models.opportunity import NormalizedOpportunity
-from rfp_finder.store import OpportunityStore, RunRecord
+from rfp_finder.store import ExampleStore, OpportunityStore, RunRecord
 
 
 def _make_opp(
@@ -86,6 +87,43 @@ class TestOpportunityStoreUpsert:
         assert len(all_opps) == 2
 
 
+    def test_upsert_many_counts_new_and_amended(self, store: OpportunityStore) -> None:
+        """upsert_many applies upsert rules across batches in one call."""
+        store.upsert(_make_opp(opp_id="canadabuys:a", source_id="a", content_hash="h1"))
+        store.upsert(_make_opp(opp_id="canadabuys:b", source_id="b", content_hash="h1"))
+        opps = [
+            _make_opp(opp_id="canadabuys:a", source_id="a", content_hash="h1"),
+            _make_opp(opp_id="canadabuys:b", source_id="b", content_hash="h2"),
+            _make_opp(opp_id="canadabuys:c", source_id="c"),
+            _make_opp(opp_id="canadabuys:d", source_id="d"),
+            _make_opp(opp_id="canadabuys:c", source_id="c", content_hash="h3"),
+        ]
+        assert store.upsert_many(opps, batch_size=2) == (2, 2)
+        assert len(store.get_all()) == 4
+        assert store.get("canadabuys:c").content_hash == "h3"
+
+    def test_upsert_many_empty(self, store: OpportunityStore) -> None:
+        assert store.upsert_many([]) == (0, 0)
+
+    def test_uses_wal_journal(self, store: OpportunityStore, temp_db: Path) -> None:
+        with sqlite3.connect(temp_db) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_schema_reapplied_only_when_out_of_date(self, store: OpportunityStore, temp_db: Path) -> None:
+        """A database stamped with the current schema skips the script; others rerun it."""
+        conn = sqlite3.connect(temp_db)
+        conn.execute("DROP INDEX idx_opportunities_source")
+        conn.commit()
+        OpportunityStore(temp_db)
+        index = "SELECT 1 FROM sqlite_master WHERE name = 'idx_opportunities_source'"
+        assert conn.execute(index).fetchone() is None
+        conn.execute("PRAGMA user_version = 0")
+        conn.commit()
+        ExampleStore(temp_db)
+        assert conn.execute(index).fetchone() is not None
+        conn.close()
+
+
 class TestOpportunityStoreQueries:
     """Tests for get_all, get_by_status, get_modified_since, get."""
 
@@ -109,6 +147,15 @@ class TestOpportunityStoreQueries:
         closed_opps = store.get_by_status("closed")
         assert len(closed_opps) == 1
 
+    def test_get_by_status_limit_offset(self, store: OpportunityStore) -> None:
+        """limit/offset page through get_by_status in the same order."""
+        for i in range(5):
+            store.upsert(_make_opp(opp_id=f"canadabuys:{i}", source_id=str(i), status="open"))
+        ids = [o.id for o in store.get_by_status("open")]
+        assert [o.id for o in store.get_by_status("open", limit=2)] == ids[:2]
+        assert [o.id for o in store.get_by_status("open", limit=2, offset=2)] == ids[2:4]
+        assert [o.id for o in store.get_by_status("open", offset=3)] == ids[3:]
+
     def test_get_by_status_respects_resolved_status(self, store: OpportunityStore) -> None:
         """Opportunities with past closing_at are stored as closed."""
         past = datetime.now(timezone.utc) - timedelta(days=1)
@@ -117,6 +164,46 @@ class TestOpportunityStoreQueries:
         closed = store.get_by_status("closed")
         assert any(o.id == "canadabuys:past" for o in closed)
 
+    def test_iter_opportunities_matches_get_queries(self, store: OpportunityStore) -> None:
+        """iter_opportunities yields the same rows as get_all/get_by_status across batches."""
+        for i in range(5):
+            status = "closed" if i % 2 else "open"
+            store.upsert(_make_opp(opp_id=f"canadabuys:{i}", source_id=str(i), status=status))
+        assert [o.id for o in store.iter_opportunities(batch_size=2)] == [
+            o.id for o in store.get_all()
+        ]
+        assert [o.id for o in store.iter_opportunities("open", batch_size=2)] == [
+            o.id for o in store.get_by_status("open")
+        ]
+
+    def test_count(self, store: OpportunityStore) -> None:
+        """count matches the number of rows, optionally by status."""
+        store.upsert(_make_opp(opp_id="canadabuys:1", source_id="1", status="open"))
+        store.upsert(_make_opp(opp_id="canadabuys:2", source_id="2", status="closed"))
+        store.upsert(_make_opp(opp_id="canadabuys:3", source_id="3", status="open"))
+        assert store.count() == 3
+        assert store.count("open") == 2
+        assert store.count("amended") == 0
+
+    def test_closing_window_prefilters_in_sql(self, store: OpportunityStore) -> None:
+        """closing_window keeps rows closing inside it (any UTC offset) and rows without a date."""
+        now = datetime.now(timezone.utc)
+        eastern = timezone(timedelta(hours=-5))
+        closings = {
+            "past": now - timedelta(days=1),
+            "soon": (now + timedelta(days=2)).astimezone(eastern),
+            "naive": (now + timedelta(days=3)).replace(tzinfo=None),
+            "far": now + timedelta(days=90),
+            "none": None,
+        }
+        for name, closing in closings.items():
+            store.upsert(_make_opp(opp_id=name, source_id=name, closing_at=closing))
+        window = (now, now + timedelta(days=30))
+        ids = {o.id for o in store.iter_opportunities(closing_window=window)}
+        assert ids == {"soon", "naive", "none"}
+        assert store.count(closing_window=window) == 3
+        assert store.count("open", closing_window=window) == 3
+
     def test_get_modified_since(self, store: OpportunityStore) -> None:
         """get_modified_since returns opps modified after given time."""
         store.upsert(_make_opp(opp_id="1"))
@@ -136,6 +223,31 @@ class TestOpportunityStoreQueries:
         assert store.get("canadabuys:nonexistent") is None
 
 
+class TestOpportunityStoreFilterCache:
+    """Tests for get_many, fingerprint and the filter result cache."""
+
+    def test_get_many_keeps_requested_order(self, store: OpportunityStore) -> None:
+        for i in range(3):
+            store.upsert(_make_opp(opp_id=f"canadabuys:{i}", source_id=str(i)))
+        ids = ["canadabuys:2", "canadabuys:missing", "canadabuys:0"]
+        assert [o.id for o in store.get_many(ids)] == ["canadabuys:2", "canadabuys:0"]
+
+    def test_fingerprint_changes_on_upsert(self, store: OpportunityStore) -> None:
+        empty = store.fingerprint()
+        store.upsert(_make_opp())
+        after_insert = store.fingerprint()
+        assert after_insert != empty
+        store.upsert(_make_opp(content_hash="changed"))
+        assert store.fingerprint() != after_insert
+
+    def test_filter_cache_round_trip(self, store: OpportunityStore) -> None:
+        assert store.get_filter_cache("k") is None
+        store.put_filter_cache("k", ["canadabuys:1", "canadabuys:2"])
+        assert store.get_filter_cache("k") == ["canadabuys:1", "canadabuys:2"]
+        store.put_filter_cache("k", [])
+        assert store.get_filter_cache("k") == []
+
+
 class TestOpportunityStoreRuns:
     """Tests for run tracking."""
 
@@ -164,3 +276,29 @@ class TestOpportunityStoreRuns:
         assert row["items_fetched"] == 10
         assert row["items_new"] == 5
         assert row["items_amended"] == 2
+
+
+class TestExampleStore:
+    """Tests for ExampleStore batch inserts."""
+
+    def test_add_many_inserts_all_rows(self, temp_db: Path) -> None:
+        ex_store = ExampleStore(temp_db)
+        rows = [("https://a.example/1", "good"), ("https://a.example/2", "bad")]
+        assert ex_store.add_many("p1", rows) == 2
+        assert ex_store.add_many("p1", []) == 0
+        listed = {(e.url, e.label) for e in ex_store.list_by_profile("p1")}
+        assert listed == set(rows)
+
+    def test_add_many_rejects_bad_label(self, temp_db: Path) -> None:
+        ex_store = ExampleStore(temp_db)
+        with pytest.raises(ValueError):
+            ex_store.add_many("p1", [("https://a.example/1", "maybe")])
+        assert ex_store.list_by_profile("p1") == []
+
+    def test_filter_new_urls_skips_stored_and_duplicate_urls(self, temp_db: Path) -> None:
+        ex_store = ExampleStore(temp_db)
+        ex_store.add_many("p1", [("https://a.example/1", "good")])
+        ex_store.add_many("p2", [("https://a.example/2", "good")])
+        candidates = ["https://a.example/1", "https://a.example/2", "https://a.example/2"]
+        assert ex_store.filter_new_urls("p1", candidates) == ["https://a.example/2"]
+        assert ex_store.filter_new_urls("p1", []) == []